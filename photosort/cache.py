@@ -0,0 +1,136 @@
+"""
+Persistent metadata cache keyed by file path, size, and modification time.
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Container, Dict, Iterable, Optional, Tuple
+
+from .constants import get_logger, json_loads
+
+
+class MetadataCache:
+    """SQLite-backed cache of per-file metadata records.
+
+    Records are stored under a kind (e.g. the exiftool query that produced
+    them) and are only returned while the file's size and mtime still match,
+    so changed files are transparently re-read. A read-only cache never
+    creates or writes the database (used for dry runs).
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS metadata ("
+        "kind TEXT NOT NULL, path TEXT NOT NULL, size INTEGER NOT NULL, "
+        "mtime_ns INTEGER NOT NULL, record TEXT NOT NULL, PRIMARY KEY (kind, path))"
+    )
+    _QUERY_CHUNK = 500  # Stay well under SQLite's bound-parameter limit
+
+    def __init__(self, db_path: Path, read_only: bool = False):
+        self.db_path = db_path
+        self.read_only = read_only
+        self.logger = get_logger("photosort.cache")
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._disabled = False
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use, disabling the cache if that fails."""
+        if self._conn is not None or self._disabled:
+            return self._conn
+
+        try:
+            if self.read_only:
+                if not self.db_path.exists():
+                    self._disabled = True
+                    return None
+                self._conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True,
+                                             check_same_thread=False)
+            else:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                self._conn.execute(self._SCHEMA)
+                self._conn.commit()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Metadata cache unavailable ({self.db_path}): {e}")
+            self._conn = None
+            self._disabled = True
+        return self._conn
+
+    def get_many(self, kind: str, keys: Dict[str, Tuple[int, int]]) -> Dict[str, Dict]:
+        """Return cached records for paths whose (size, mtime_ns) still match."""
+        hits = {}
+        with self._lock:
+            conn = self._connect()
+            if conn is None or not keys:
+                return hits
+
+            paths = list(keys)
+            try:
+                for i in range(0, len(paths), self._QUERY_CHUNK):
+                    chunk = paths[i:i + self._QUERY_CHUNK]
+                    rows = conn.execute(
+                        "SELECT path, size, mtime_ns, record FROM metadata "
+                        f"WHERE kind = ? AND path IN ({','.join('?' * len(chunk))})",
+                        [kind, *chunk],
+                    )
+                    for path, size, mtime_ns, record in rows:
+                        if keys[path] == (size, mtime_ns):
+                            hits[path] = json_loads(record)
+            except (sqlite3.Error, ValueError) as e:
+                self.logger.debug(f"Metadata cache lookup failed: {e}")
+        return hits
+
+    def put_many(self, kind: str, entries: Iterable[Tuple[str, int, int, Dict]]) -> None:
+        """Store (path, size, mtime_ns, record) entries, replacing older records."""
+        if self.read_only:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO metadata (kind, path, size, mtime_ns, record) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(kind, path, size, mtime_ns, json.dumps(record))
+                     for path, size, mtime_ns, record in entries],
+                )
+                conn.commit()
+            except sqlite3.Error as e:
+                self.logger.debug(f"Metadata cache update failed: {e}")
+
+    def prune(self, kind: str, prefix: str, keep: Container[str]) -> int:
+        """Delete records under a path prefix that are not in keep. Return the count.
+
+        Imported files are moved out of the source folder, so without pruning
+        their records would accumulate forever.
+        """
+        if self.read_only:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return 0
+            try:
+                # Compare the prefix with substr() since paths may contain LIKE wildcards
+                rows = conn.execute(
+                    "SELECT path FROM metadata WHERE kind = ? AND substr(path, 1, ?) = ?",
+                    (kind, len(prefix), prefix),
+                )
+                stale = [(kind, path) for (path,) in rows if path not in keep]
+                if stale:
+                    conn.executemany("DELETE FROM metadata WHERE kind = ? AND path = ?", stale)
+                    conn.commit()
+                return len(stale)
+            except sqlite3.Error as e:
+                self.logger.debug(f"Metadata cache prune failed: {e}")
+                return 0
+
+    def close(self) -> None:
+        """Close the database connection; it is reopened on next use."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -5,8 +5,8 @@ Command-line interface for photosort.
 import argparse
 import grp
 import logging
+import os
 import re
-import subprocess
 import sys
 from pathlib import Path
 from typing import Optional
@@ -14,25 +14,39 @@ from typing import Optional
 from rich.progress import Progress
 
 from .config import Config
-from .constants import get_console, get_logger, PROGRAM
+from .constants import (get_console, get_logger, LIVEPHOTO_WORKERS, PROGRAM,
+                        PROGRESS_REFRESH_PER_SECOND, PROGRESS_UPDATE_INTERVAL)
 from .core import PhotoSorter
 from .progress import ProgressContext
 
 
 console = get_console()
 
+# Octal file mode: 3-4 digits, 0-7 only (\Z rejects a trailing newline, unlike $)
+FILE_MODE_RE = re.compile(r'^[0-7]{3,4}\Z')
+
 
 def parse_file_mode(mode_str: str) -> int:
     """Convert octal string (e.g., '644') to integer mode."""
     try:
-        # Ensure it's a valid octal string (3-4 digits, 0-7 only)
-        if not re.match(r'^[0-7]{3,4}$', mode_str):
+        if not FILE_MODE_RE.match(mode_str):
             raise ValueError(f"Invalid mode format: {mode_str}")
         return int(mode_str, 8)
     except ValueError as e:
         raise argparse.ArgumentTypeError(f"Invalid file mode: {e}")
 
 
+def parse_threads(threads_str: str) -> int:
+    """Convert thread count string to a positive integer."""
+    try:
+        threads = int(threads_str)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid thread count: {threads_str}")
+    if threads < 1:
+        raise argparse.ArgumentTypeError(f"Thread count must be at least 1: {threads_str}")
+    return threads
+
+
 def parse_group(group_str: str) -> int:
     """Convert group name to GID with validation."""
     try:
@@ -43,13 +57,16 @@ def parse_group(group_str: str) -> int:
 
 def set_directory_groups(dest_path: Path, group_name: str) -> None:
     """Set group ownership on all directories in destination path."""
+    def raise_error(error: OSError) -> None:
+        raise error
+
     try:
-        result = subprocess.run(
-            ["find", str(dest_path), "-type", "d", "-exec", "chgrp", group_name, "{}", "+"],
-            capture_output=True, text=True, check=True
-        )
+        gid = grp.getgrnam(group_name).gr_gid
+        # Walk in-process with one chown per directory instead of spawning find/chgrp
+        for root, _, _ in os.walk(dest_path, onerror=raise_error):
+            os.chown(root, -1, gid)
         console.print(f"Applied group '{group_name}' to destination directories")
-    except subprocess.CalledProcessError as e:
+    except (KeyError, OSError) as e:
         console.print(f"[yellow]Warning: Could not set group on directories: {e}[/yellow]")
 
 
@@ -68,6 +85,7 @@ def create_parser(config: Config) -> argparse.ArgumentParser:
     group_help = "Group ownership for organized files (e.g., staff, users, wheel)"
     timezone_help = "Default timezone for creation time metadata if missing"
     video_help = "Disable automatic HEVC/H.265 conversion of legacy video formats"
+    threads_help = f"Worker threads for metadata reads and Live Photo pairs (default: {LIVEPHOTO_WORKERS})"
     version_help = f"Display the version number of {PROGRAM} and exit"
 
     if last_source:
@@ -146,6 +164,10 @@ Shell Completion:
         "--no-convert-videos", action="store_true",
         help=video_help
     )
+    parser.add_argument(
+        "--threads", "-t", type=parse_threads, metavar="N",
+        help=threads_help
+    )
     parser.add_argument(
         "--verbose", "-v", action="store_true",
         help="Enable verbose logging"
@@ -315,7 +337,8 @@ def main(config_path: Optional[Path] = None) -> int:
         move_files=not args.copy,
         file_mode=file_mode,
         group_gid=group_gid,
-        convert_videos=convert_videos
+        convert_videos=convert_videos,
+        threads=args.threads
     )
 
     # Find and process files
@@ -333,9 +356,9 @@ def main(config_path: Optional[Path] = None) -> int:
 
     try:
         # Create a single progress bar for all operations
-        with Progress(console=console) as progress:
+        with Progress(console=console, refresh_per_second=PROGRESS_REFRESH_PER_SECOND) as progress:
             task = progress.add_task("Processing all files...", total=total_items)
-            progress_ctx = ProgressContext(progress, task)
+            progress_ctx = ProgressContext(progress, task, PROGRESS_UPDATE_INTERVAL)
 
             # Process Live Photo pairs first (to avoid filename collisions)
             if livephoto_pairs:
@@ -3,6 +3,7 @@ File extension constants, program metadata, and settings for photo organization.
 """
 
 import logging
+import os
 import subprocess
 from rich.console import Console
 
@@ -24,6 +25,13 @@ def get_logger(name: str = PROGRAM) -> logging.Logger:
     return logging.getLogger(name)
 
 
+# Fast JSON parsing with orjson when installed (accepts bytes, raises json.JSONDecodeError)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
 # Tool availability
 def check_tool_availability(cmd: str, version_flag: str = "-h") -> bool:
     """Check availability of a command-line tool on this system."""
@@ -41,8 +49,8 @@ sips_available = check_tool_availability("sips", "-v")
 
 
 # File extension constants
-JPG_EXTENSIONS = (".jpg", ".jpeg", ".jpe")
-IMG_EXTENSIONS = (
+JPG_EXTENSIONS = frozenset((".jpg", ".jpeg", ".jpe"))
+IMG_EXTENSIONS = frozenset((
     ".3fr", ".3pr", ".arw", ".ce1", ".ce2", ".cib", ".cmt", ".cr2", ".craw",
     ".crw", ".dc2", ".dcr", ".dng", ".erf", ".exf", ".fff", ".fpx", ".gif",
     ".gray", ".grey", ".gry", ".heic", ".iiq", ".kc2", ".kdc", ".mdc", ".mef",
@@ -50,9 +58,9 @@ IMG_EXTENSIONS = (
     ".pcd", ".pef", ".png", ".ptx", ".ra2", ".raf", ".raw", ".rw2", ".rwl",
     ".rwz", ".sd0", ".sd1", ".sr2", ".srf", ".srw", ".st4", ".st5", ".st6",
     ".st7", ".st8", ".stx", ".tif", ".tiff", ".x3f", ".ycbcra"
-)
-PHOTO_EXTENSIONS = JPG_EXTENSIONS + IMG_EXTENSIONS
-MOVIE_EXTENSIONS = (
+))
+PHOTO_EXTENSIONS = JPG_EXTENSIONS | IMG_EXTENSIONS
+MOVIE_EXTENSIONS = frozenset((
     ".3g2", ".3gp", ".asf", ".asx", ".avi", ".flv", ".m4v", ".mov", ".mp4",
     ".mpg", ".rm", ".srt", ".swf", ".vob", ".wmv", ".aepx", ".ale", ".avp",
     ".avs", ".bdm", ".bik", ".bin", ".bsf", ".camproj", ".cpi", ".dash",
@@ -62,15 +70,20 @@ MOVIE_EXTENSIONS = (
     ".otrkey", ".pds", ".prproj", ".psh", ".r3d", ".rcproject", ".rmvb",
     ".scm", ".smil", ".snagproj", ".sqz", ".stx", ".swi", ".tix", ".trp",
     ".ts", ".veg", ".vf", ".vro", ".webm", ".wlmp", ".wtv", ".xvid", ".yuv",
-)
-METADATA_EXTENSIONS = (
+))
+METADATA_EXTENSIONS = frozenset((
     ".aae", ".dat", ".ini", ".cfg", ".xml", ".plist", ".json", ".txt", ".log",
     ".info", ".meta", ".properties", ".conf", ".config", ".xmp"
-)
-NUISANCE_EXTENSIONS = (
+))
+NUISANCE_EXTENSIONS = frozenset((
     ".ds_store", ".thumbs.db", ".desktop.ini", "thumbs.db"
-)
-VALID_EXTENSIONS = PHOTO_EXTENSIONS + MOVIE_EXTENSIONS
+))
+VALID_EXTENSIONS = PHOTO_EXTENSIONS | MOVIE_EXTENSIONS
+
+# Live Photo component extensions
+LIVEPHOTO_IMAGE_EXTENSIONS = frozenset((".heic", ".jpeg", ".jpg"))
+LIVEPHOTO_VIDEO_EXTENSIONS = frozenset((".mov", ".mp4"))
+LIVEPHOTO_EXTENSIONS = LIVEPHOTO_IMAGE_EXTENSIONS | LIVEPHOTO_VIDEO_EXTENSIONS
 
 
 # Video codecs
@@ -78,3 +91,15 @@ MODERN_VIDEO_CODECS = (
     "hevc", "h265", "h264", "avc", "av1", "vp9"
 )
 
+
+# Progress display
+PROGRESS_REFRESH_PER_SECOND = 4  # Rich progress bar redraw rate
+PROGRESS_UPDATE_INTERVAL = 10  # Show every Nth per-file status description
+
+
+# Concurrency
+LIVEPHOTO_WORKERS = min(8, (os.cpu_count() or 1) + 4)  # Threads for I/O-bound Live Photo pair processing
+EXIFTOOL_WORKERS = min(os.cpu_count() or 1, 4)  # Parallel exiftool processes for large scans
+EXIFTOOL_BATCH_SIZE = 250  # Files per exiftool command (paths go via -@, so argv length is no limit)
+EXIFTOOL_PARALLEL_THRESHOLD = 500  # Minimum uncached candidate files before scanning in parallel
+
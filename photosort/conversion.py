@@ -7,11 +7,12 @@ import os
 import shutil
 import subprocess
 import tempfile
+import threading
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-from .constants import (get_logger, ffmpeg_available, ffprobe_available,
+from .constants import (get_logger, ffmpeg_available, ffprobe_available, json_loads,
                         MODERN_VIDEO_CODECS, MOVIE_EXTENSIONS, PROGRAM)
 from .file_operations import FileOperations
 from .progress import ProgressContext
@@ -34,6 +35,7 @@ class VideoConverter:
         self.file_ops = file_ops
         self.convert_videos = convert_videos
         self.logger = get_logger("photosort.conversion")
+        self._encode_lock = threading.Lock()  # ffmpeg saturates the cores, so encode one at a time
         if not ffmpeg_available:
             self.logger.warning("ffmpeg unavailable: skipping legacy video conversion")
 
@@ -50,10 +52,10 @@ class VideoConverter:
                         "-select_streams", "v:0",
                         str(video_path),
                     ],
-                    capture_output=True, text=True, check=True,
+                    capture_output=True, check=True,
                 )
 
-                data = json.loads(result.stdout)
+                data = json_loads(result.stdout)
                 if data.get("streams"):
                     codec = data["streams"][0].get("codec_name", "").lower()
                     return codec
@@ -82,10 +84,10 @@ class VideoConverter:
                         "-show_entries", "format_tags",
                         str(video_path),
                     ],
-                    capture_output=True, text=True, check=True,
+                    capture_output=True, check=True,
                 )
 
-                data = json.loads(result.stdout)
+                data = json_loads(result.stdout)
                 if data.get("format", {}).get("tags", {}):
                     content_id = data["format"]["tags"]["com.apple.quicktime.content.identifier"]
                     self.logger.debug(f"Found {video_path.name}:ContentIdentifier = {content_id}")
@@ -154,7 +156,8 @@ class VideoConverter:
                 progress_ctx.update(f"Converting: {input_path.name}")
 
             # Run conversion
-            result = subprocess.run(cmd, capture_output=True, check=True)
+            with self._encode_lock:
+                result = subprocess.run(cmd, capture_output=True, check=True)
 
             # Verify the converted file exists and has content
             if not temp_path.exists() or temp_path.stat().st_size == 0:
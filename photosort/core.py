@@ -10,6 +10,7 @@ import re
 import shutil
 import subprocess
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -19,24 +20,31 @@ from rich.logging import RichHandler
 from rich.progress import Progress
 from rich.table import Table
 
-from .constants import (get_console, get_logger, JPG_EXTENSIONS, METADATA_EXTENSIONS,
-                        MOVIE_EXTENSIONS, PHOTO_EXTENSIONS, PROGRAM, VALID_EXTENSIONS)
+from .cache import MetadataCache
+from .constants import (get_console, get_logger, exiftool_available, EXIFTOOL_BATCH_SIZE,
+                        JPG_EXTENSIONS, LIVEPHOTO_WORKERS, METADATA_EXTENSIONS, MOVIE_EXTENSIONS,
+                        PHOTO_EXTENSIONS, PROGRAM, PROGRESS_REFRESH_PER_SECOND,
+                        PROGRESS_UPDATE_INTERVAL, VALID_EXTENSIONS)
 from .conversion import VideoConverter, ConversionResult
+from .exiftool import ExifToolDaemon
 from .file_operations import FileOperations
 from .history import HistoryManager
 from .livephoto import LivePhotoProcessor
 from .progress import ProgressContext
 from .stats import StatsManager
-from .timestamps import get_image_creation_date, get_video_creation_date
+from .timestamps import (default_timezone, get_image_creation_date,
+                         get_video_creation_date, read_image_creation_dates)
 
 
 class PhotoSorter:
     """Main class for organizing photos and videos."""
 
+    CREATION_DATE_CACHE_KIND = "creation-date"  # Metadata cache namespace for file dates
+
     def __init__(self, source: Path, dest: Path, root_dir: Optional[Path],
                  dry_run: bool = False, move_files: bool = True,
                  file_mode: Optional[int] = None, group_gid: Optional[int] = None,
-                 convert_videos: bool = True):
+                 convert_videos: bool = True, threads: Optional[int] = None):
         self.source = source
         self.dest = dest
         self.dry_run = dry_run
@@ -44,6 +52,7 @@ class PhotoSorter:
         self.file_mode = file_mode
         self.group_gid = group_gid
         self.convert_videos = convert_videos
+        self.workers = threads or LIVEPHOTO_WORKERS  # Metadata reads and Live Photo pairs
         self.root_dir = root_dir or Path.home() / f".{PROGRAM}"
         self.stats_manager = StatsManager()
 
@@ -81,22 +90,39 @@ class PhotoSorter:
         self.metadata_dir = self.history_manager.get_metadata_dir()
         self.legacy_dir = self.history_manager.get_legacy_videos_dir()
 
+        # Persistent exiftool process shared by metadata scans (started on first use)
+        self.exiftool = ExifToolDaemon() if exiftool_available else None
+        # Dates read ahead for the current batch of files (video dates may be None)
+        self._image_dates: Dict[Path, datetime] = {}
+        self._video_dates: Dict[Path, Optional[datetime]] = {}
+
+        # Cache exiftool results across runs (never written during a dry run)
+        self.metadata_cache = MetadataCache(self.history_manager.get_cache_dir() / "exif_cache.db",
+                                            read_only=dry_run)
+
         # Initialize Live Photo processor with dependencies
         self.live_photo_processor = LivePhotoProcessor(
             source=source, dest=dest, video_converter=self.video_converter,
             history_manager=self.history_manager, file_ops=self.file_ops,
-            stats_manager=self.stats_manager
+            stats_manager=self.stats_manager, exiftool=self.exiftool,
+            metadata_cache=self.metadata_cache, workers=self.workers
         )
 
     def get_creation_date(self, file_path: Path) -> datetime:
         """Extract creation date from file metadata."""
         # Handle video files with ffprobe
         if file_path.suffix.lower() in MOVIE_EXTENSIONS:
-            video_date = get_video_creation_date(file_path)
+            if file_path in self._video_dates:
+                video_date = self._video_dates[file_path]
+            else:
+                video_date = get_video_creation_date(file_path)
             if video_date:
                 return video_date
 
-        # Handle all other photo files
+        # Handle all other photo files, preferring a date read with the current batch
+        creation_date = self._image_dates.get(file_path)
+        if creation_date is not None:
+            return creation_date
         return get_image_creation_date(file_path)
 
     def find_source_files(self) -> Tuple[List[Path], List[Path], Dict[str, Dict]]:
@@ -104,25 +130,37 @@ class PhotoSorter:
         media_files = []
         metadata_files = []
 
-        # Media and metadata sorting
-        for file_path in self.source.rglob("*"):
-            if file_path.is_file():
-                ext = file_path.suffix.lower()
-                if ext in VALID_EXTENSIONS:
-                    media_files.append(file_path)
-                elif ext in METADATA_EXTENSIONS:
-                    metadata_files.append(file_path)
+        # Media and metadata sorting; the extension is checked on the bare name
+        # so only matching files are promoted to Path objects
+        for entry in self.file_ops.scan_files(self.source):
+            ext = os.path.splitext(entry.name)[1].lower()
+            if ext in VALID_EXTENSIONS:
+                media_files.append(Path(entry.path))
+            elif ext in METADATA_EXTENSIONS:
+                metadata_files.append(Path(entry.path))
 
         # Live Photo detection and sorting
-        media_files, livephoto_pairs = self.live_photo_processor.detect_livephoto_pairs(media_files)
+        try:
+            media_files, livephoto_pairs = self.live_photo_processor.detect_livephoto_pairs(media_files)
+        finally:
+            # Release the exiftool process and cache between phases; the
+            # process restarts on first use when photo dates are read
+            if self.exiftool is not None:
+                self.exiftool.terminate()
+            self.metadata_cache.close()
 
         if livephoto_pairs:
             self.logger.info(f"Detected {len(livephoto_pairs)} Live Photo pairs")
 
         return sorted(media_files), sorted(metadata_files), livephoto_pairs
 
-    def get_destination_path(self, file_path: Path, creation_date: datetime) -> Tuple[Path, bool]:
-        """Generate destination path and dupe check. Returns (dest_path, is_dupe)."""
+    def get_destination_path(self, file_path: Path, creation_date: datetime,
+                             file_size: Optional[int] = None) -> Tuple[Path, bool]:
+        """Generate destination path and dupe check. Returns (dest_path, is_dupe).
+
+        Pass file_size when already known so burst collisions are rejected by
+        size without re-stat'ing the source on every candidate name.
+        """
         year = f"{creation_date.year:04d}"
         month = f"{creation_date.month:02d}"
 
@@ -136,7 +174,7 @@ class PhotoSorter:
 
         # Handle filename conflicts (due to photo bursts) and report duplicates
         while dest_file.exists():
-            if self.file_ops.is_duplicate(file_path, dest_file):
+            if self.file_ops.is_duplicate(file_path, dest_file, source_size=file_size):
                 return dest_file, True
             counter += 1
             dest_file = dest_dir / f"{timestamp}_{counter:03d}{ext}"
@@ -174,6 +212,9 @@ class PhotoSorter:
             if progress_ctx:
                 progress_ctx.advance()
 
+        if progress_ctx:
+            progress_ctx.flush()
+
     def process_livephoto_pairs(self, livephoto_pairs: Dict[str, Dict],
                                 progress_ctx: Optional[ProgressContext] = None) -> None:
         """Process Live Photo pairs with shared basenames."""
@@ -185,36 +226,106 @@ class PhotoSorter:
 
         # If no progress context provided, create our own
         if progress_ctx is None:
-            with Progress(console=self.console) as progress:
+            with Progress(console=self.console,
+                          refresh_per_second=PROGRESS_REFRESH_PER_SECOND) as progress:
                 task = progress.add_task("Processing files...", total=len(files))
-                progress_ctx = ProgressContext(progress, task)
+                progress_ctx = ProgressContext(progress, task, PROGRESS_UPDATE_INTERVAL)
                 self._process_files_with_progress(files, progress_ctx)
         else:
             self._process_files_with_progress(files, progress_ctx)
 
     def _process_files_with_progress(self, files: List[Path], progress_ctx: ProgressContext) -> None:
         """Internal method to process files with a given progress context."""
-        for file_path in files:
+        # Drop cached dates for source files that have since been moved or deleted
+        self.metadata_cache.prune(self.CREATION_DATE_CACHE_KIND, f"{self.source}{os.sep}",
+                                  {str(f) for f in files})
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for i in range(0, len(files), EXIFTOOL_BATCH_SIZE):
+                    batch = files[i:i + EXIFTOOL_BATCH_SIZE]
+                    self._read_batch_dates(batch, executor)
+
+                    for file_path in batch:
+                        try:
+                            self._process_single_file(file_path, progress_ctx)
+                        except Exception as e:
+                            self.logger.error(f"Error processing {file_path}: {e}")
+                            self.stats_manager.increment_unsorted()
+                            if not self.dry_run:
+                                self.file_ops.archive_file(file_path, self.unsorted_dir,
+                                                           preserve_structure=False)
+
+                        progress_ctx.advance()
+        finally:
+            self._image_dates = {}
+            self._video_dates = {}
+            if self.exiftool is not None:
+                self.exiftool.terminate()
+            self.metadata_cache.close()
+
+        progress_ctx.flush()
+
+    def _read_batch_dates(self, batch: List[Path], executor: ThreadPoolExecutor) -> None:
+        """Read creation dates for a batch of files ahead of processing them.
+
+        Dates cached for unchanged files are reused if they were converted to
+        the current default timezone; otherwise photo dates come from one
+        exiftool command while video dates are read by concurrent ffprobe
+        calls, both through the worker pool.
+        """
+        file_keys = {}
+        for file_path in batch:
             try:
-                self._process_single_file(file_path, progress_ctx)
-            except Exception as e:
-                self.logger.error(f"Error processing {file_path}: {e}")
-                self.stats_manager.increment_unsorted()
-                if not self.dry_run:
-                    self.file_ops.archive_file(file_path, self.unsorted_dir, preserve_structure=False)
-
-            progress_ctx.advance()
+                st = os.stat(file_path)
+            except OSError:
+                continue
+            file_keys[str(file_path)] = (st.st_size, st.st_mtime_ns)
+        cached = self.metadata_cache.get_many(self.CREATION_DATE_CACHE_KIND, file_keys)
+        # Cached dates are naive local times, so they are only valid in the zone
+        # they were converted to (re-read and replaced after a --timezone change)
+        tz_name = default_timezone().key
+
+        image_dates, video_dates = {}, {}
+        photos, videos = [], []
+        for file_path in batch:
+            is_video = file_path.suffix.lower() in MOVIE_EXTENSIONS
+            record = cached.get(str(file_path))
+            if record is not None and record.get('tz') == tz_name:
+                dates = video_dates if is_video else image_dates
+                dates[file_path] = datetime.fromisoformat(record['date'])
+            elif is_video:
+                videos.append(file_path)
+            else:
+                photos.append(file_path)
+
+        image_future = executor.submit(read_image_creation_dates, photos, self.exiftool)
+        read_video_dates = dict(zip(videos, executor.map(get_video_creation_date, videos)))
+        metadata_image_dates, fallback_image_dates = image_future.result()
+
+        # Remember metadata-derived dates for the next run; sips or mtime dates
+        # for photos exiftool could not date (or failed on) are not cached
+        new_dates = {f: d for f, d in read_video_dates.items() if d is not None}
+        new_dates.update(metadata_image_dates)
+        if new_dates:
+            self.metadata_cache.put_many(self.CREATION_DATE_CACHE_KIND, (
+                (str(f), *file_keys[str(f)], {'date': d.isoformat(), 'tz': tz_name})
+                for f, d in new_dates.items() if str(f) in file_keys
+            ))
+
+        image_dates.update(metadata_image_dates)
+        image_dates.update(fallback_image_dates)
+        video_dates.update(read_video_dates)
+        self._image_dates, self._video_dates = image_dates, video_dates
 
     def _process_single_file(self, file_path: Path, progress_ctx: ProgressContext) -> None:
         """Process a single media file."""
-        # Check if file still exists before processing
-        if not file_path.exists():
+        # A single stat checks the file still exists and captures its size before any operations
+        try:
+            file_size = file_path.stat().st_size
+        except FileNotFoundError:
             self.logger.debug(f"Skipping {file_path} - file no longer exists (already processed)")
             return
 
-        # Get file size before any operations
-        file_size = file_path.stat().st_size
-
         # Get creation date
         creation_date = self.get_creation_date(file_path)
 
@@ -228,30 +339,34 @@ class PhotoSorter:
                 self.logger.warning(f"Processing original video file: {conversion.source_file}")
                 conversion.processing_file = conversion.source_file
 
-        # Generate destination path based on the processing file
-        dest_path, is_dupe = self.get_destination_path(conversion.processing_file, creation_date)
-
-        # Gracefully cleanup if duplicates found
-        if is_dupe:
-            self.stats_manager.increment_duplicates()
-            progress_ctx.update(f"Skipping duplicate: {conversion.processing_file.name}")
-            self.file_ops.delete_safely(conversion.source_file, conversion.temp_file)
-            return
-
-        # Move processed file to destination
-        if self.file_ops.move_file_safely(conversion.processing_file, dest_path):
-            # If we converted a video, handle cleanup based on mode
-            if conversion.was_converted:
-                self.file_ops.archive_file(conversion.source_file, self.legacy_dir,
-                                           preserve_structure=True)
-                self.file_ops.delete_safely(conversion.temp_file)
-
-            # Update stats and progress
-            self.stats_manager.record_successful_file(file_path, file_size)
-            progress_ctx.update(f"Processed: {file_path.name}")
-        else:
-            if self.file_ops.archive_file(conversion.source_file, self.unsorted_dir):
-                self.stats_manager.increment_unsorted()
+        # Temporary conversion output is removed on every exit path
+        try:
+            # Generate destination path based on the processing file (size known unless converted)
+            processing_size = None if conversion.processing_file != file_path else file_size
+            dest_path, is_dupe = self.get_destination_path(conversion.processing_file, creation_date,
+                                                           processing_size)
+
+            # Gracefully cleanup if duplicates found
+            if is_dupe:
+                self.stats_manager.increment_duplicates()
+                progress_ctx.update(f"Skipping duplicate: {conversion.processing_file.name}")
+                self.file_ops.delete_safely(conversion.source_file)
+                return
+
+            # Move processed file to destination
+            if self.file_ops.move_file_safely(conversion.processing_file, dest_path):
+                # If we converted a video, handle cleanup based on mode
+                if conversion.was_converted:
+                    self.file_ops.archive_file(conversion.source_file, self.legacy_dir,
+                                               preserve_structure=True)
+
+                # Update stats and progress
+                self.stats_manager.record_successful_file(file_path, file_size)
+                progress_ctx.update(f"Processed: {file_path.name}")
+            else:
+                if self.file_ops.archive_file(conversion.source_file, self.unsorted_dir):
+                    self.stats_manager.increment_unsorted()
+        finally:
             self.file_ops.delete_safely(conversion.temp_file)
 
     def print_summary(self) -> None:
@@ -19,7 +19,7 @@ _photosort_completions() {
     # All available options
     local opts="--source -s --dest -d --dry-run -n --copy -c --verbose -v
                 --mode -m --group -g --timezone --tz --no-convert-videos
-                --yes -y --version -V --help -h"
+                --threads -t --yes -y --version -V --help -h"
 
     # Handle 'completion' subcommand
     local subcmd=""
@@ -71,6 +71,12 @@ _photosort_completions() {
             return 0
             ;;
 
+        # Thread count completion
+        --threads|-t)
+            COMPREPLY=($(compgen -W "1 2 4 8" -- "$cur"))
+            return 0
+            ;;
+
         # Timezone completion (common timezones)
         --timezone|--tz)
             local timezones="America/New_York America/Los_Angeles America/Chicago
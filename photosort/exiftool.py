@@ -0,0 +1,177 @@
+"""
+Helpers for running exiftool and parsing its JSON output.
+"""
+
+import atexit
+import os
+import subprocess
+import tempfile
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .constants import get_logger, json_loads
+
+logger = get_logger("photosort.exiftool")
+
+
+def iter_json_records(lines: Iterable[bytes]) -> Iterator[Dict]:
+    """Incrementally parse exiftool -json output, yielding one record per file.
+
+    exiftool writes each top-level record's closing brace unindented on its
+    own line ("}," between records and "}]" after the last), so records can be
+    parsed as soon as they are complete without buffering the whole array.
+    A malformed record is skipped rather than ending the stream.
+    """
+    record = []
+    for line in lines:
+        line = line.rstrip()
+        if line.startswith(b"["):
+            line = line[1:]
+        if line.startswith(b"}") and line.endswith(b"]"):
+            line = line[:-1]
+        if line in (b"}", b"},"):
+            record.append(b"}")
+            try:
+                parsed = json_loads(b"\n".join(record))
+            except ValueError:
+                # Skip a malformed record without losing the rest of the stream
+                logger.debug(f"Skipping malformed exiftool record: {record[:2]}")
+            else:
+                yield parsed
+            record = []
+        elif line and line != b"]":
+            record.append(line)
+
+
+def run_exiftool_json(args: List[str], executable: str = "exiftool") -> Iterator[Dict]:
+    """Run a one-shot exiftool -json command, yielding a record per file.
+
+    Arguments are passed through a temporary -@ argfile rather than argv, so
+    large batches of paths cannot exceed the system's argument size limit.
+    """
+    with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".args",
+                                     delete=False) as argfile:
+        argfile.write("".join(f"{arg}\n" for arg in args))
+    try:
+        proc = subprocess.Popen([executable, "-json", "-@", argfile.name],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+        try:
+            yield from iter_json_records(proc.stdout)
+        finally:
+            proc.stdout.close()
+            proc.wait()
+    finally:
+        os.unlink(argfile.name)
+
+
+def exiftool_json(args: List[str], daemon: Optional["ExifToolDaemon"] = None) -> Iterator[Dict]:
+    """Run exiftool -json with the given arguments, preferring a persistent daemon.
+
+    Falls back to a one-shot exiftool process if there is no daemon or it
+    cannot start.
+    """
+    if daemon is not None and daemon.start():
+        yield from daemon.execute_json(args)
+        return
+    yield from run_exiftool_json(args)
+
+
+class ExifToolDaemon:
+    """Persistent exiftool process running in -stay_open mode.
+
+    Arguments for each command are written to exiftool's stdin one per line
+    (the -@ argfile protocol), so the Perl startup cost is paid once per run
+    instead of once per batch. Each command ends with a numbered -executeN so
+    its {readyN} reply can't be confused with another command's. The process
+    is started lazily on first use and shut down at interpreter exit if it is
+    never terminated explicitly.
+    """
+
+    def __init__(self, executable: str = "exiftool"):
+        self.executable = executable
+        self.logger = logger
+        self._process: Optional[subprocess.Popen] = None
+        self._command_id = 0
+
+    @property
+    def running(self) -> bool:
+        """Check if the exiftool process is alive."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> bool:
+        """Start the exiftool process if needed. Return whether it is running."""
+        if self.running:
+            return True
+        try:
+            self._process = subprocess.Popen(
+                [self.executable, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=-1,
+            )
+        except OSError as e:
+            self.logger.debug(f"Could not start exiftool daemon: {e}")
+            self._process = None
+            return False
+        atexit.register(self.terminate)
+        return True
+
+    def execute(self, args: List[str]) -> Iterator[bytes]:
+        """Run one exiftool command, yielding its stdout lines until the ready sentinel."""
+        if not self.start():
+            raise subprocess.CalledProcessError(-1, [self.executable] + args)
+
+        process = self._process
+        self._command_id += 1
+        ready = b"{ready%d}" % self._command_id
+        process.stdin.write("".join(f"{arg}\n" for arg in args).encode())
+        process.stdin.write(b"-execute%d\n" % self._command_id)
+        process.stdin.flush()
+
+        done = False
+        try:
+            for line in iter(process.stdout.readline, b""):
+                line_id = line.rstrip()
+                if line_id == ready:
+                    done = True
+                    return
+                if line_id.startswith(b"{ready"):
+                    # Stale sentinel from an earlier, abandoned command
+                    continue
+                yield line
+            raise subprocess.CalledProcessError(process.poll() or -1, [self.executable] + args)
+        finally:
+            if not done and process.poll() is None:
+                # Consumer stopped early: drain the rest so the next command stays in sync
+                for line in iter(process.stdout.readline, b""):
+                    if line.rstrip() == ready:
+                        break
+
+    def execute_json(self, args: List[str]) -> Iterator[Dict]:
+        """Run one exiftool command with -json, yielding a record per file."""
+        return iter_json_records(self.execute(["-json"] + args))
+
+    def terminate(self) -> None:
+        """Ask exiftool to exit and wait for it."""
+        if self._process is None:
+            return
+        process, self._process = self._process, None
+        atexit.unregister(self.terminate)
+        try:
+            if process.poll() is None:
+                process.stdin.write(b"-stay_open\nFalse\n")
+                process.stdin.flush()
+            process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+        finally:
+            process.stdout.close()
+
+    def __enter__(self) -> "ExifToolDaemon":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.terminate()
@@ -2,6 +2,7 @@
 Shared file operations and utilities for photo and video organization.
 """
 
+import errno
 import hashlib
 import json
 import os
@@ -9,11 +10,16 @@ import shutil
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, Iterator, Optional, Tuple
 
 from .constants import (get_logger, exiftool_available, sips_available, JPG_EXTENSIONS,
                         NUISANCE_EXTENSIONS, PROGRAM)
 
+HASH_CHUNK_SIZE = 8192
+
+# Names of other lengths can't be nuisance files, so they skip the lower() copy
+NUISANCE_NAME_LENGTHS = frozenset(len(name) for name in NUISANCE_EXTENSIONS)
+
 
 class FileOperations:
     """Utility class for file operations, duplicate detection, permissions, and cleanup."""
@@ -26,6 +32,8 @@ class FileOperations:
         self.file_mode = mode
         self.group_gid = gid
         self.logger = get_logger()
+        self._known_dirs = set()  # Directories already ensured during this run
+        self._digests: Dict[str, Tuple[Tuple, bytes]] = {}  # path -> ((size, mtime_ns, limit), digest)
 
     @staticmethod
     def normalize_jpg_extension(ext: str) -> str:
@@ -34,52 +42,108 @@ class FileOperations:
             return ".jpg"
         return ext.lower()
 
-    @staticmethod
-    def is_duplicate(source_file: Path, dest_file: Path,
-                     hash_size: Optional[int] = None) -> bool:
-        """Check if files are duplicates based on size and content."""
-        if not dest_file.exists():
+    def is_duplicate(self, source_file: Path, dest_file: Path,
+                     hash_size: Optional[int] = None,
+                     source_size: Optional[int] = None) -> bool:
+        """Check if files are duplicates based on size and content.
+
+        Pass source_size when already known to skip re-stat'ing the source.
+        """
+        # A single stat serves as both the existence and the size check
+        try:
+            dest_size = dest_file.stat().st_size
+        except FileNotFoundError:
             return False
 
-        # Quick size check
-        if source_file.stat().st_size != dest_file.stat().st_size:
+        # Quick size check before any content is read
+        if source_size is None:
+            source_size = source_file.stat().st_size
+        if source_size != dest_size:
             return False
 
         # For same-sized files, also check content hash (up to hash_size limit)
-        return FileOperations.same_size_same_hash(source_file, dest_file, hash_size)
+        return self.same_size_same_hash(source_file, dest_file, hash_size)
 
-    @staticmethod
-    def same_size_same_hash(file1: Path, file2: Path,
-                             check_limit: Optional[int]) -> bool:
+    def same_size_same_hash(self, file1: Path, file2: Path,
+                            check_limit: Optional[int]) -> bool:
         """Compare SHA-256 hashes of same-sized files up to optional limit (in MB)."""
-        size_limit = check_limit * 1024 * 1024 if check_limit else None
-        bytes_processed = 0
-
-        try:
-            hash1 = hashlib.sha256()
-            hash2 = hashlib.sha256()
+        digest1 = self.file_digest(file1, check_limit)
+        return digest1 is not None and digest1 == self.file_digest(file2, check_limit)
 
-            with open(file1, 'rb') as f1, open(file2, 'rb') as f2:
-                while True:
-                    chunk1 = f1.read(8192)
-                    chunk2 = f2.read(8192)
+    def file_digest(self, file_path: Path, check_limit: Optional[int] = None) -> Optional[bytes]:
+        """Return the SHA-256 digest of a file up to optional limit (in MB), or None on error.
 
-                    # Both should end together since same size
-                    if not chunk1:
+        Digests are memoized per path and reused while the file's size and
+        mtime are unchanged, so files compared repeatedly during collision
+        handling are only read once.
+        """
+        size_limit = check_limit * 1024 * 1024 if check_limit else None
+        key = str(file_path)
+        try:
+            st = os.stat(key)
+            stamp = (st.st_size, st.st_mtime_ns, size_limit)
+            cached = self._digests.get(key)
+            if cached is not None and cached[0] == stamp:
+                return cached[1]
+
+            hasher = hashlib.sha256()
+            remaining = size_limit
+            with open(key, 'rb') as f:
+                while remaining is None or remaining > 0:
+                    chunk = f.read(HASH_CHUNK_SIZE if remaining is None
+                                   else min(HASH_CHUNK_SIZE, remaining))
+                    if not chunk:
                         break
+                    hasher.update(chunk)
+                    if remaining is not None:
+                        remaining -= len(chunk)
+        except OSError as e:
+            self.logger.debug(f"Could not hash {file_path}: {e}")
+            return None
 
-                    # Check size limit before hashing
-                    if size_limit and bytes_processed + len(chunk1) > size_limit:
-                        break
+        digest = hasher.digest()
+        self._digests[key] = (stamp, digest)
+        return digest
 
-                    hash1.update(chunk1)
-                    hash2.update(chunk2)
-                    bytes_processed += len(chunk1)  # Same as len(chunk2)
+    @staticmethod
+    def rename_or_move(source: Path, dest: Path) -> bool:
+        """Move file with a single rename syscall, falling back to shutil.move across filesystems.
 
-            return hash1.hexdigest() == hash2.hexdigest()
-        except Exception:
+        Returns True if the file was moved by an atomic rename.
+        """
+        try:
+            os.replace(source, dest)
+            return True
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source), str(dest))
             return False
 
+    def scan_files(self, root: Path) -> Iterator[os.DirEntry]:
+        """Yield directory entries for all regular files below root.
+
+        Uses os.scandir, whose entries carry the file type from the directory
+        listing, so no per-file stat is needed. Symlinked directories are not
+        followed and unreadable directories are skipped, as with Path.rglob.
+        """
+        stack = [str(root)]
+        while stack:
+            directory = stack.pop()
+            try:
+                # List each directory up front so callers may delete the entries yielded
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                self.logger.debug(f"Skipping unreadable directory {directory}: {e}")
+                continue
+
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
     def move_file_safely(self, source: Path, dest: Path) -> bool:
         """Move or copy file with validation, permissions, and dry-run support."""
         if self.dry_run:
@@ -89,18 +153,22 @@ class FileOperations:
             # Create destination directory
             self.ensure_directory(dest.parent)
 
-            # Move the file
+            # Move the file; memoized digests for either path no longer apply
+            self._digests.pop(str(source), None)
+            self._digests.pop(str(dest), None)
+            renamed = False
             if self.move_files:
-                shutil.move(str(source), str(dest))
+                renamed = self.rename_or_move(source, dest)
             else:
                 shutil.copy2(str(source), str(dest))
 
-            # Verify the operation
-            if not dest.exists():
-                raise FileNotFoundError(f"File not found after move: {dest}")
+            # Verify the operation (a completed atomic rename needs no extra stats)
+            if not renamed:
+                if not dest.exists():
+                    raise FileNotFoundError(f"File not found after move: {dest}")
 
-            if self.move_files and source.exists():
-                raise FileExistsError(f"Source file still exists after move: {source}")
+                if self.move_files and source.exists():
+                    raise FileExistsError(f"Source file still exists after move: {source}")
 
             # Apply file permissions if specified
             self.apply_file_permissions(dest)
@@ -119,8 +187,10 @@ class FileOperations:
 
     def ensure_directory(self, directory: Path) -> None:
         """Create directory and parents if needed, with dry-run support."""
-        if not self.dry_run and not directory.exists():
-            directory.mkdir(parents=True, exist_ok=True)
+        if self.dry_run or directory in self._known_dirs:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        self._known_dirs.add(directory)
 
     def apply_file_permissions(self, file_path: Path) -> None:
         """Apply file permissions if mode is specified."""
@@ -156,6 +226,20 @@ class FileOperations:
             counter += 1
         return dest_path
 
+    def reserve_unique_path(self, dest_dir: Path, file_path: Path) -> Path:
+        """Atomically claim a unique file path with counter, leaving an empty placeholder."""
+        stem = file_path.stem
+        suffix = file_path.suffix
+        dest_path = dest_dir / file_path.name
+        counter = 1
+        while True:
+            try:
+                os.close(os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL))
+                return dest_path
+            except FileExistsError:
+                dest_path = dest_dir / f"{stem}_{counter:03d}{suffix}"
+                counter += 1
+
     def delete_safely(self, *files_to_delete: Optional[Path]) -> bool:
         """Unlink the file path(s) provided. Return all(success)."""
         if self.dry_run:
@@ -182,32 +266,46 @@ class FileOperations:
         if self.dry_run:
             return True
 
-        # Gracefully return silently if file to be archived does not exist
-        if not file_path.exists():
-            return False
-
+        placeholder = None
         try:
             if preserve_structure and source_root:
                 # Preserve relative path structure
                 relative_path = file_path.relative_to(source_root)
                 dest_path = archive_dir / relative_path
+                self.ensure_directory(dest_path.parent)
             else:
-                # Simple move to archive directory with unique naming
-                dest_path = self.create_unique_path(archive_dir, file_path)
-
-            self.ensure_directory(dest_path.parent)
+                # Simple move to archive directory, claiming a unique name so
+                # concurrent archivers cannot pick the same destination
+                self.ensure_directory(archive_dir)
+                dest_path = placeholder = self.reserve_unique_path(archive_dir, file_path)
 
+            # Replace the placeholder (if any) with the archived file
             if self.move_files:
-                shutil.move(str(file_path), str(dest_path))
+                self.rename_or_move(file_path, dest_path)
             else:
                 shutil.copy2(str(file_path), str(dest_path))
 
             self.logger.info(f"Archived: {file_path} -> {dest_path}")
             return True
+        except FileNotFoundError:
+            # Gracefully return silently if file to be archived does not exist
+            self._discard_placeholder(placeholder)
+            return False
         except Exception as e:
             self.logger.warning(f"Could not archive {file_path}: {e}")
+            self._discard_placeholder(placeholder)
             return False
 
+    @staticmethod
+    def _discard_placeholder(placeholder: Optional[Path]) -> None:
+        """Remove an unused path reservation left by reserve_unique_path."""
+        if placeholder is None:
+            return
+        try:
+            os.unlink(placeholder)
+        except OSError:
+            pass
+
     def cleanup_source_directory(self, source: Path, unsorted_path: Path) -> None:
         """Clean up source directory in MOVE mode by removing nuisance files,
         pruning empty folders, and archiving unknown files."""
@@ -216,32 +314,33 @@ class FileOperations:
 
         self.logger.info("Cleaning source folder...")
 
-        # First, remove all nuisance files recursively
+        # A single bottom-up walk removes nuisance files and then prunes each
+        # subfolder, which has already been cleaned by the time its parent is visited
         nuisance_count = 0
-        for file_path in source.rglob("*"):
-            if file_path.is_file() and file_path.name.lower() in NUISANCE_EXTENSIONS:
-                if self.delete_safely(file_path):
-                    nuisance_count += 1
-                else:
-                    self.logger.warning(f"[yellow]Warning: Could not remove {file_path}: {e}[/yellow]")
+        for thisdir, subdirs, files in os.walk(source, topdown=False):
+            for name in files:
+                if len(name) in NUISANCE_NAME_LENGTHS and name.lower() in NUISANCE_EXTENSIONS:
+                    file_path = Path(thisdir) / name
+                    if self.delete_safely(file_path):
+                        nuisance_count += 1
+                    else:
+                        self.logger.warning(f"[yellow]Warning: Could not remove {file_path}[/yellow]")
 
-        if nuisance_count > 0:
-            self.logger.info(f"Removed {nuisance_count} nuisance files (.DS_Store, etc.)")
-
-        # Recursively prune empty subfolders from the source tree
-        for thisdir, subdirs, _ in os.walk(source, topdown=False):
             for thissubdir in subdirs:
                 try:
-                    os.rmdir(Path(thisdir) / thissubdir)
+                    os.rmdir(os.path.join(thisdir, thissubdir))
                 except OSError:
                     pass
 
+        if nuisance_count > 0:
+            self.logger.info(f"Removed {nuisance_count} nuisance files (.DS_Store, etc.)")
+
         # Move remaining unknown files to history folder
-        unknowns = list(source.glob("*"))
+        unknowns = list(source.iterdir())
         if unknowns:
             self.logger.info(f"Moving {len(unknowns)} unknown files...")
             self.ensure_directory(unsorted_path)
             for remaining in unknowns:
                 dest_path = self.create_unique_path(unsorted_path, remaining)
-                shutil.move(remaining, dest_path)
+                self.rename_or_move(remaining, dest_path)
 
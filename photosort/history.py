@@ -88,6 +88,10 @@ class HistoryManager:
         """Get path for legacy video files in import history."""
         return self.import_folder / "LegacyVideos"
 
+    def get_cache_dir(self) -> Path:
+        """Get path for persistent caches shared across imports."""
+        return self.root_dir / "cache"
+
     def log_import_summary(self, source: Path, dest: Path, stats_manager: "StatsManager", success: bool) -> None:
         """Log import summary to global imports.log."""
         if self.file_ops.dry_run:
@@ -0,0 +1,157 @@
+"""
+In-process reader for the JPEG EXIF tags used by Live Photo detection.
+"""
+
+import struct
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from .constants import get_logger
+
+logger = get_logger("photosort.jpeg")
+
+# EXIF tags (IFD0 and Exif sub-IFD)
+EXIF_IFD_POINTER = 0x8769
+CREATE_DATE = 0x9004
+OFFSET_TIME_DIGITIZED = 0x9012
+SUB_SEC_TIME_DIGITIZED = 0x9292
+MAKER_NOTE = 0x927C
+
+# Apple MakerNote: "Apple iOS\0", version, "MM", then an IFD whose offsets
+# are relative to the start of the MakerNote
+APPLE_MAKERNOTE_HEADER = b"Apple iOS\x00"
+APPLE_MAKERNOTE_IFD_START = 14
+APPLE_CONTENT_IDENTIFIER = 0x0011
+
+# Byte sizes of TIFF field types
+TIFF_TYPE_SIZES = {1: 1, 2: 1, 3: 2, 4: 4, 5: 8, 6: 1, 7: 1, 8: 2, 9: 4, 10: 8, 11: 4, 12: 8}
+
+
+def read_livephoto_tags(path: Path) -> Optional[Dict[str, str]]:
+    """Read ContentIdentifier and creation date tags from a JPEG without exiftool.
+
+    Returns a record shaped like exiftool -json output (SourceFile plus any
+    tags found, dates in raw EXIF form), which may lack a ContentIdentifier
+    for non-Apple images. Returns None if the file can't be parsed here, so
+    the caller can fall back to exiftool.
+    """
+    try:
+        with open(path, "rb") as f:
+            tiff = _read_exif_segment(f)
+    except OSError as e:
+        logger.debug(f"Could not read {path}: {e}")
+        return None
+
+    record = {"SourceFile": str(path)}
+    if tiff is None:
+        # A well-formed JPEG without EXIF carries none of the tags
+        return record
+
+    try:
+        _parse_tiff(tiff, record)
+    except (struct.error, ValueError, IndexError) as e:
+        logger.debug(f"Malformed EXIF in {path}: {e}")
+        return None
+    return record
+
+
+def _read_exif_segment(f: BinaryIO) -> Optional[bytes]:
+    """Return the TIFF payload of the EXIF APP1 segment, or None if there is none.
+
+    Raises OSError for input that isn't a readable JPEG.
+    """
+    if f.read(2) != b"\xff\xd8":
+        raise OSError("not a JPEG file")
+
+    while True:
+        marker = f.read(2)
+        if len(marker) < 2 or marker[0] != 0xFF:
+            raise OSError("truncated or corrupt JPEG segment")
+        code = marker[1]
+        if code == 0xFF:
+            # Fill byte before a marker
+            f.seek(-1, 1)
+            continue
+        if code in (0xDA, 0xD9):
+            # Start of scan or end of image: no more metadata segments
+            return None
+        if 0xD0 <= code <= 0xD7 or code == 0x01:
+            # Standalone markers carry no length
+            continue
+
+        header = f.read(2)
+        if len(header) < 2:
+            raise OSError("truncated JPEG segment")
+        length = struct.unpack(">H", header)[0] - 2
+        if code == 0xE1:
+            data = f.read(length)
+            if data.startswith(b"Exif\x00\x00"):
+                return data[6:]
+        else:
+            f.seek(length, 1)
+
+
+def _parse_tiff(tiff: bytes, record: Dict[str, str]) -> None:
+    """Extract the Live Photo tags from a TIFF/EXIF block into record."""
+    if tiff[:2] == b"II":
+        order = "<"
+    elif tiff[:2] == b"MM":
+        order = ">"
+    else:
+        raise ValueError("bad TIFF byte order")
+
+    ifd0 = struct.unpack_from(f"{order}I", tiff, 4)[0]
+    exif_ifd = _read_ifd(tiff, ifd0, order).get(EXIF_IFD_POINTER)
+    if exif_ifd is None:
+        return
+    exif_offset = struct.unpack(f"{order}I", exif_ifd[1][:4])[0]
+    tags = _read_ifd(tiff, exif_offset, order)
+
+    create_date = _ascii(tags.get(CREATE_DATE))
+    if create_date:
+        record["CreateDate"] = create_date
+        # Composite like exiftool's SubSecCreateDate, e.g. 2025:05:06 19:41:34.745-04:00
+        sub_sec = _ascii(tags.get(SUB_SEC_TIME_DIGITIZED))
+        offset = _ascii(tags.get(OFFSET_TIME_DIGITIZED))
+        record["SubSecCreateDate"] = (create_date + (f".{sub_sec}" if sub_sec else "")
+                                      + (offset or ""))
+
+    maker_note = tags.get(MAKER_NOTE)
+    if maker_note is not None and maker_note[1].startswith(APPLE_MAKERNOTE_HEADER):
+        note = maker_note[1]
+        apple_tags = _read_ifd(note, APPLE_MAKERNOTE_IFD_START, ">")
+        content_id = _ascii(apple_tags.get(APPLE_CONTENT_IDENTIFIER))
+        if content_id:
+            record["ContentIdentifier"] = content_id
+
+
+def _read_ifd(data: bytes, offset: int, order: str) -> Dict[int, Tuple[int, bytes]]:
+    """Read an IFD at offset, returning {tag: (type, raw value bytes)}.
+
+    Value offsets are taken relative to the start of data.
+    """
+    count = struct.unpack_from(f"{order}H", data, offset)[0]
+    entries = {}
+    for i in range(count):
+        tag, field_type, n, value = struct.unpack_from(f"{order}HHI4s", data, offset + 2 + 12 * i)
+        size = TIFF_TYPE_SIZES.get(field_type)
+        if size is None:
+            continue
+        length = size * n
+        if length > 4:
+            start = struct.unpack(f"{order}I", value)[0]
+            if start + length > len(data):
+                raise ValueError(f"tag 0x{tag:04x} points past the end of the block")
+            value = data[start:start + length]
+        else:
+            value = value[:length]
+        entries[tag] = (field_type, value)
+    return entries
+
+
+def _ascii(entry: Optional[Tuple[int, bytes]]) -> Optional[str]:
+    """Decode an ASCII tag value, dropping NUL padding and surrounding blanks."""
+    if entry is None:
+        return None
+    text = entry[1].split(b"\x00", 1)[0].decode("ascii", "replace").strip()
+    return text or None
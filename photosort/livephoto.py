@@ -2,35 +2,55 @@
 Live Photo processing functionality.
 """
 
-import json
 import os
 import shutil
 import subprocess
 import tempfile
+import threading
+from collections import ChainMap, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from rich.progress import Progress
 
-from .constants import (get_console, get_logger, exiftool_available, JPG_EXTENSIONS,
-                        MOVIE_EXTENSIONS, PROGRAM)
+from .cache import MetadataCache
+from .constants import (get_console, get_logger, exiftool_available, EXIFTOOL_BATCH_SIZE,
+                        EXIFTOOL_PARALLEL_THRESHOLD, EXIFTOOL_WORKERS, JPG_EXTENSIONS,
+                        LIVEPHOTO_IMAGE_EXTENSIONS, LIVEPHOTO_VIDEO_EXTENSIONS, LIVEPHOTO_WORKERS,
+                        MOVIE_EXTENSIONS, PROGRAM, PROGRESS_REFRESH_PER_SECOND,
+                        PROGRESS_UPDATE_INTERVAL)
 from .conversion import ConversionResult
+from .exiftool import ExifToolDaemon, exiftool_json
+from .jpeg import read_livephoto_tags
 from .progress import ProgressContext
-from .timestamps import canonical_EXIF_date, get_image_creation_date
+from .stats import StatsManager
+from .timestamps import canonical_EXIF_date, get_image_creation_dates
+
+
+# Date tags read for Live Photo components (priority is applied by canonical_EXIF_date)
+LIVEPHOTO_DATE_FIELDS = ('SubSecCreateDate', 'CreationDate', 'CreationTime', 'CreateDate')
 
 
 class LivePhotoProcessor:
     """Handles Apple Live Photo detection and processing."""
 
+    CONTENT_ID_CACHE_KIND = "livephoto-content-id"  # Metadata cache namespace for scan records
+
     def __init__(self, source: Path, dest: Path, video_converter, history_manager,
-                 file_ops, stats_manager):
+                 file_ops, stats_manager, exiftool: Optional[ExifToolDaemon] = None,
+                 metadata_cache: Optional[MetadataCache] = None,
+                 workers: Optional[int] = None):
         self.source = source
         self.dest = dest
         self.video_converter = video_converter
         self.history_manager = history_manager
         self.file_ops = file_ops
         self.stats_manager = stats_manager
+        self.exiftool = exiftool  # Shared stay_open exiftool process, if provided
+        self.metadata_cache = metadata_cache  # Persistent exiftool results, if provided
+        self.workers = workers or LIVEPHOTO_WORKERS  # Threads for processing pairs
         self.logger = get_logger()
         self.console = get_console()
 
@@ -40,36 +60,133 @@ class LivePhotoProcessor:
 
     def detect_livephoto_pairs(self, media_files: List[Path]) -> Tuple[List[Path], Dict[str, Dict]]:
         """Detect LivePhoto pairs by matching Apple ContentIdentifier keys."""
+        # Both detection paths share one pass of filename splitting
+        candidates = self._classify_candidates(media_files)
         if exiftool_available:
             try:
-                return self._detect_by_content_identifier(media_files)
+                return self._detect_by_content_identifier(media_files, candidates)
             except subprocess.CalledProcessError as e:
                 self.logger.debug(f"exiftool failed: {e}")
-                return self._detect_by_basename_fallback(media_files)
+                return self._detect_by_basename_fallback(media_files, candidates)
         else:
-            return self._detect_by_basename_fallback(media_files)
+            return self._detect_by_basename_fallback(media_files, candidates)
 
-    def _detect_by_content_identifier(self, media_files: List[Path]) -> Tuple[List[Path], Dict[str, Dict]]:
+    @staticmethod
+    def _classify_candidates(media_files: List[Path]) -> List[Tuple[Path, str, str]]:
+        """Return (path, stem, 'image' or 'video') for each possible Live Photo file."""
+        candidates = []
+        for file_path in media_files:
+            stem, ext = os.path.splitext(file_path.name)
+            ext = ext.lower()
+            if ext in LIVEPHOTO_IMAGE_EXTENSIONS:
+                candidates.append((file_path, stem, 'image'))
+            elif ext in LIVEPHOTO_VIDEO_EXTENSIONS:
+                candidates.append((file_path, stem, 'video'))
+        return candidates
+
+    def _detect_by_content_identifier(self, media_files: List[Path],
+                                      candidates: List[Tuple[Path, str, str]]
+                                      ) -> Tuple[List[Path], Dict[str, Dict]]:
         """Primary Live Photo detection using Apple ContentIdentifier metadata."""
-        content_map = {}
+        content_map = defaultdict(dict)  # content id -> {'image'/'video': (path, record)}
         livephoto_pairs = {}
-        non_livephoto_files = set()  # Use set to prevent duplicate entries
+        used_paths = set()  # Files claimed by a detected Live Photo pair
 
-        img_ext = ('.heic', '.jpeg', '.jpg')
-        mov_ext = ('.mov', '.mp4')
-        lp_exts = img_ext + mov_ext
+        # Potential Live Photo files, keyed as exiftool reports them (SourceFile)
+        candidate_kinds = {str(f): (f, kind) for f, _, kind in candidates}
 
-        # Get potential Live Photo files
-        lp_candidates = [f for f in media_files if f.suffix.lower() in lp_exts]
-
-        if not lp_candidates:
+        # A pair needs both an image and a video, so skip exiftool if either is missing
+        videos = [f for f, _, kind in candidates if kind == 'video']
+        images = [f for f, _, kind in candidates if kind == 'image']
+        if not (videos and images):
             return media_files, {}
 
-        # Call exiftool for content id and dates for all possible candidate files
-        exif_data = []
+        # Drop cached records for source files that have since been moved or deleted
+        if self.metadata_cache is not None:
+            self.metadata_cache.prune(self.CONTENT_ID_CACHE_KIND, f"{self.source}{os.sep}",
+                                      candidate_kinds)
 
-        # Process files in batches to reduce subprocess overhead
-        batch_size = 100  # Process 100 files at a time
+        # Group files by ContentIdentifier as exiftool records stream in, and
+        # register each pair as soon as both of its halves have been seen
+        for file_data in self._scan_videos_first(videos, images):
+            content_id = file_data.get('ContentIdentifier')
+            candidate = candidate_kinds.get(file_data.get('SourceFile'))
+            if not content_id or candidate is None:
+                continue
+
+            # Categorize as image or video, keeping the record for its dates
+            file_path, kind = candidate
+            data = content_map[content_id]
+            data[kind] = (file_path, file_data)
+            if len(data) < 2:
+                continue
+            (image_file, image_data), (video_file, video_data) = data['image'], data['video']
+
+            # A later record for the same id replaces the earlier pair
+            previous = livephoto_pairs.pop(content_id, None)
+            if previous:
+                used_paths.discard(previous['image_file'])
+                used_paths.discard(previous['video_file'])
+
+            # Valid Live Photo pair found; without a date, the files are
+            # treated as individual files. Dates are only looked up now, with
+            # the newest record's tags taking precedence
+            other_data = video_data if file_data is image_data else image_data
+            creation_date = canonical_EXIF_date(ChainMap(file_data, other_data))
+            if creation_date:
+                milliseconds = creation_date.microsecond // 1000
+                shared_basename = self._generate_shared_basename(creation_date, milliseconds)
+
+                livephoto_pairs[content_id] = {
+                    'image_file': image_file,
+                    'video_file': video_file,
+                    'shared_basename': shared_basename,
+                    'creation_date': creation_date,
+                    'milliseconds': milliseconds
+                }
+                used_paths.add(image_file)
+                used_paths.add(video_file)
+
+                self.logger.debug(f"Live Photo detected: {image_file.name} + {video_file.name}")
+
+        # Everything not claimed by a Live Photo pair is processed individually
+        non_livephoto_files = [f for f in media_files if f not in used_paths]
+
+        return non_livephoto_files, livephoto_pairs
+
+    def _scan_videos_first(self, videos: List[Path], images: List[Path]) -> Iterator[Dict]:
+        """Scan videos, then images only if some video carries a ContentIdentifier.
+
+        Libraries without iPhone videos (Android, cameras, screenshots) can't
+        contain a Live Photo pair, so their images are never read.
+        """
+        found_content_id = False
+        for record in self._scan_content_identifiers(videos):
+            found_content_id = found_content_id or bool(record.get('ContentIdentifier'))
+            yield record
+
+        if found_content_id:
+            yield from self._scan_content_identifiers(images)
+        else:
+            self.logger.debug(f"No video has a ContentIdentifier; skipping {len(images)} images")
+
+    def _scan_content_identifiers(self, lp_candidates: List[Path]) -> Iterator[Dict]:
+        """Read content id and dates, yielding each file's record as it is parsed.
+
+        Records come from the metadata cache, then the in-process JPEG reader,
+        then exiftool for everything else.
+        """
+        # Reuse cached records for files unchanged since a previous run
+        cached, file_keys = {}, {}
+        if self.metadata_cache is not None:
+            for f in lp_candidates:
+                try:
+                    st = os.stat(f)
+                except OSError:
+                    continue
+                file_keys[str(f)] = (st.st_size, st.st_mtime_ns)
+            cached = self.metadata_cache.get_many(self.CONTENT_ID_CACHE_KIND, file_keys)
+        uncached = [f for f in lp_candidates if str(f) not in cached] if cached else lp_candidates
 
         # Create progress bar for EXIF scanning
         with Progress(console=self.console) as progress:
@@ -78,163 +195,174 @@ class LivePhotoProcessor:
                 total=len(lp_candidates)
             )
 
-            # Process files in batches
-            for i in range(0, len(lp_candidates), batch_size):
-                batch = lp_candidates[i:i + batch_size]
-
-                # Call exiftool with multiple files at once
-                cmd = [
-                    "exiftool",
-                    "-q",
-                    "-json",
-                    "-d", "%Y-%m-%dT%H:%M:%S%3f%z",
-                    "-api", "QuickTimeUTC",
-                    "-ContentIdentifier",
-                    "-LivePhotoAuto",
-                    "-SubSecCreateDate",
-                    "-CreationDate",
-                    "-CreationTime",
-                    "-CreateDate",
-                ]
-                # Add all files in batch to command
-                cmd.extend(str(f) for f in batch)
-
-                result = subprocess.run(cmd, capture_output=True, text=True)
-
-                # Parse JSON output - will be a list of objects, one per file
-                if result.stdout.strip():
-                    try:
-                        json_data = json.loads(result.stdout)
-                        if isinstance(json_data, list):
-                            exif_data.extend(json_data)
-                    except json.JSONDecodeError:
-                        self.logger.debug(f"Failed to parse exiftool JSON for batch starting at index {i}")
+            if cached:
+                yield from cached.values()
+                progress.update(scan_task, advance=len(cached))
 
-                # Update progress for the batch
-                progress.update(scan_task, advance=len(batch))
-
-        # Group files by ContentIdentifier
-        for file_data in exif_data:
-            content_id = file_data.get('ContentIdentifier')
-            if not content_id:
-                continue
-
-            if content_id not in content_map:
-                content_map[content_id] = {'image': None, 'video': None, 'dates': {}}
-
-            file_path = Path(file_data['SourceFile'])
-            file_ext = file_path.suffix.lower()
-
-            # Categorize as image or video
-            if file_ext in img_ext:
-                content_map[content_id]['image'] = file_path
-            elif file_ext in mov_ext:
-                content_map[content_id]['video'] = file_path
-
-            # Store all available dates for this file
-            dates = {}
-            for date_field in ['SubSecCreateDate', 'CreationDate', 'CreationTime', 'CreateDate']:
-                if date_field in file_data:
-                    dates[date_field] = file_data[date_field]
-
-            if dates:
-                content_map[content_id]['dates'].update(dates)
-
-        # Process matched pairs
-        for content_id, data in content_map.items():
-            if data['image'] and data['video']:
-                # Valid Live Photo pair found
-                creation_date = canonical_EXIF_date(data['dates'])
-                if creation_date:
-                    if creation_date.microsecond:
-                        milliseconds = int(creation_date.microsecond / 1000)
-                    else:
-                        milliseconds = 0
-
-                    shared_basename = self._generate_shared_basename(creation_date, milliseconds)
-
-                    livephoto_pairs[content_id] = {
-                        'image_file': data['image'],
-                        'video_file': data['video'],
-                        'shared_basename': shared_basename,
-                        'creation_date': creation_date,
-                        'milliseconds': milliseconds
-                    }
-
-                    self.logger.debug(f"Live Photo detected: {data['image'].name} + {data['video'].name}")
+            # JPEGs are read in-process; exiftool only sees files that can't be parsed here
+            remaining = []
+            for f in uncached:
+                record = read_livephoto_tags(f) if f.suffix.lower() in JPG_EXTENSIONS else None
+                if record is None:
+                    remaining.append(f)
                 else:
-                    # No valid date found, treat as individual files
-                    non_livephoto_files.update([data['image'], data['video']])
-
-        # Add files that weren't part of any Live Photo processing
-        livephoto_file_paths = set()
-        for pair_data in livephoto_pairs.values():
-            livephoto_file_paths.add(pair_data['image_file'])
-            livephoto_file_paths.add(pair_data['video_file'])
-
-        for file_path in media_files:
-            if file_path not in livephoto_file_paths:
-                non_livephoto_files.add(file_path)
+                    yield record
+            progress.update(scan_task, advance=len(uncached) - len(remaining))
+
+            # Process files in batches to reduce per-command overhead
+            batches = [remaining[i:i + EXIFTOOL_BATCH_SIZE]
+                       for i in range(0, len(remaining), EXIFTOOL_BATCH_SIZE)]
+
+            # Large scans are spread over several exiftool processes; only files
+            # left for exiftool count, and no worker is started without a batch
+            workers = min(EXIFTOOL_WORKERS, len(batches))
+            if len(remaining) >= EXIFTOOL_PARALLEL_THRESHOLD and workers > 1:
+                scanned = self._scan_batches_parallel(batches, workers)
+            else:
+                # Stream JSON output - one object per file, parsed as each completes
+                scanned = ((batch, exiftool_json(self._content_identifier_args(batch),
+                                                           self.exiftool))
+                           for batch in batches)
+
+            for batch, records in scanned:
+                # Records are consumed as they stream in; they are only held
+                # for the batch when they will be written to the cache
+                scanned_records = []
+                for record in records:
+                    if self.metadata_cache is not None:
+                        scanned_records.append(record)
+                    yield record
+
+                # Remember this batch's records for the next run
+                if scanned_records:
+                    self.metadata_cache.put_many(self.CONTENT_ID_CACHE_KIND, (
+                        (record['SourceFile'], *file_keys[record['SourceFile']], record)
+                        for record in scanned_records if record.get('SourceFile') in file_keys
+                    ))
 
-        return sorted(non_livephoto_files), livephoto_pairs
+                # Update progress for the batch
+                progress.update(scan_task, advance=len(batch))
 
-    def _detect_by_basename_fallback(self, media_files: List[Path]) -> Tuple[List[Path], Dict[str, Dict]]:
+    def _scan_batches_parallel(self, batches: List[List[Path]],
+                               workers: int) -> Iterator[Tuple[List[Path], List[Dict]]]:
+        """Scan batches on worker threads, each driving its own exiftool process, in batch order."""
+        local = threading.local()
+        daemons = []
+
+        def scan(batch: List[Path]) -> List[Dict]:
+            daemon = getattr(local, "daemon", None)
+            if daemon is None:
+                daemon = local.daemon = ExifToolDaemon()
+                daemons.append(daemon)
+            return list(exiftool_json(self._content_identifier_args(batch), daemon))
+
+        # Keep a bounded window of batches in flight so parsed records don't pile up
+        pending = deque()
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                try:
+                    for batch in batches:
+                        pending.append((batch, executor.submit(scan, batch)))
+                        if len(pending) >= 2 * workers:
+                            batch, future = pending.popleft()
+                            yield batch, future.result()
+                    while pending:
+                        batch, future = pending.popleft()
+                        yield batch, future.result()
+                except BaseException:
+                    for _, future in pending:
+                        future.cancel()
+                    raise
+        finally:
+            for daemon in daemons:
+                daemon.terminate()
+
+    @staticmethod
+    def _content_identifier_args(batch: List[Path]) -> List[str]:
+        """Build exiftool arguments for content id and date tags of a batch of files."""
+        args = [
+            "-q",
+            # Don't scan JPEGs to the end for trailers; -fast2 is not an option
+            # since it skips MakerNotes (where images keep ContentIdentifier)
+            # and stops at the QuickTime mdat atom, which may precede moov
+            "-fast",
+            "-d", "%Y-%m-%dT%H:%M:%S%3f%z",
+            "-api", "QuickTimeUTC",
+            "-ContentIdentifier",
+            *(f"-{field}" for field in LIVEPHOTO_DATE_FIELDS),
+        ]
+        # Add all files in batch to command
+        args.extend(str(f) for f in batch)
+        return args
+
+    def _detect_by_basename_fallback(self, media_files: List[Path],
+                                     candidates: List[Tuple[Path, str, str]]
+                                     ) -> Tuple[List[Path], Dict[str, Dict]]:
         """Fallback Live Photo detection using filename basename matching."""
         basename_map = {}
         livephoto_pairs = {}
-        non_livephoto_files = set()  # Use set to prevent duplicate entries
-
-        img_ext = ('.heic', '.jpeg', '.jpg')
-        mov_ext = ('.mov', '.mp4')
+        used_paths = set()  # Files claimed by a detected Live Photo pair
 
         # Group by filename stem (e.g., IMG_1234)
-        for file_path in media_files:
-            ext = file_path.suffix.lower()
-            if ext in img_ext or ext in mov_ext:
-                basename = file_path.stem
-                if basename not in basename_map:
-                    basename_map[basename] = {'image': None, 'video': None}
-
-                if ext in img_ext:
-                    basename_map[basename]['image'] = file_path
-                elif ext in mov_ext:
-                    basename_map[basename]['video'] = file_path
-            else:
-                non_livephoto_files.add(file_path)
+        for file_path, basename, kind in candidates:
+            basename_map.setdefault(basename, {'image': None, 'video': None})[kind] = file_path
 
-        # Process potential pairs
-        for basename, data in basename_map.items():
-            if data['image'] and data['video']:
-                # Valid pair found, use image file's creation date
-                try:
-                    creation_date = get_image_creation_date(data['image'])
-                    shared_basename = self._generate_shared_basename(creation_date, 0)
-
-                    livephoto_pairs[basename] = {
-                        'image_file': data['image'],
-                        'video_file': data['video'],
-                        'shared_basename': shared_basename,
-                        'creation_date': creation_date,
-                        'milliseconds': 0
-                    }
-
-                    self.logger.debug(f"Live Photo pair detected (basename): {data['image'].name} + {data['video'].name}")
-                except Exception as e:
-                    self.logger.debug(f"Failed to get creation date for {data['image']}: {e}")
-                    non_livephoto_files.update([data['image'], data['video']])
+        # Potential pairs; unpaired files are left for individual processing
+        pairs = [(basename, data['image'], data['video']) for basename, data in basename_map.items()
+                 if data['image'] and data['video']]
+
+        # Date all paired images in one pass, using each image's creation date
+        creation_dates = self._image_creation_dates([image_file for _, image_file, _ in pairs])
+
+        for basename, image_file, video_file in pairs:
+            creation_date = creation_dates.get(image_file)
+            if creation_date is None:
+                continue
+
+            livephoto_pairs[basename] = {
+                'image_file': image_file,
+                'video_file': video_file,
+                'shared_basename': self._generate_shared_basename(creation_date, 0),
+                'creation_date': creation_date,
+                'milliseconds': 0
+            }
+            used_paths.add(image_file)
+            used_paths.add(video_file)
+
+            self.logger.debug(f"Live Photo pair detected (basename): {image_file.name} + {video_file.name}")
+
+        # Everything not claimed by a Live Photo pair is processed individually
+        non_livephoto_files = [f for f in media_files if f not in used_paths]
+
+        return non_livephoto_files, livephoto_pairs
+
+    def _image_creation_dates(self, images: List[Path]) -> Dict[Path, datetime]:
+        """Get creation dates for images, reading as many as possible in bulk.
+
+        JPEGs are read in-process and other images go to exiftool in batches.
+        """
+        dates = {}
+        remaining = []
+        for image_file in images:
+            record = (read_livephoto_tags(image_file)
+                      if image_file.suffix.lower() in JPG_EXTENSIONS else None)
+            creation_date = canonical_EXIF_date(record) if record else None
+            if creation_date:
+                dates[image_file] = creation_date
             else:
-                if data['image']:
-                    non_livephoto_files.add(data['image'])
-                if data['video']:
-                    non_livephoto_files.add(data['video'])
+                remaining.append(image_file)
 
-        return sorted(non_livephoto_files), livephoto_pairs
+        for i in range(0, len(remaining), EXIFTOOL_BATCH_SIZE):
+            dates.update(get_image_creation_dates(remaining[i:i + EXIFTOOL_BATCH_SIZE], self.exiftool))
+        return dates
 
-    def _generate_shared_basename(self, creation_date: datetime, milliseconds: int) -> str:
+    @staticmethod
+    def _generate_shared_basename(creation_date: datetime, milliseconds: int) -> str:
         """Generate shared basename for Live Photo pair using milliseconds for counter."""
-        timestamp = creation_date.strftime("%Y%m%d_%H%M%S")
         counter = milliseconds if milliseconds > 0 else 0
-        return f"{timestamp}_{counter:03d}"
+        return (f"{creation_date.year:04d}{creation_date.month:02d}{creation_date.day:02d}_"
+                f"{creation_date.hour:02d}{creation_date.minute:02d}{creation_date.second:02d}_"
+                f"{counter:03d}")
 
     def process_livephoto_pairs(self, livephoto_pairs: Dict[str, Dict], progress_ctx=None) -> None:
         """Process Live Photo pairs with shared basenames."""
@@ -243,140 +371,225 @@ class LivePhotoProcessor:
 
         self.logger.info(f"Processing {len(livephoto_pairs)} Live Photo pairs")
 
+        # Create each year/month destination folder once instead of per file
+        month_dirs = {self._month_dir(p['creation_date']) for p in livephoto_pairs.values()}
+        for dest_dir in sorted(month_dirs):
+            self.file_ops.ensure_directory(dest_dir)
+
+        # A bar for a single pair or a dry run isn't worth its render thread;
+        # an inactive ProgressContext turns all updates into no-ops
+        if progress_ctx is None and (self.file_ops.dry_run or len(livephoto_pairs) <= 1):
+            progress_ctx = ProgressContext()
+
         # If no progress context provided, create our own
         if progress_ctx is None:
-            with Progress(console=self.console) as progress:
+            with Progress(console=self.console,
+                          refresh_per_second=PROGRESS_REFRESH_PER_SECOND) as progress:
                 task = progress.add_task("Processing Live Photos...", total=len(livephoto_pairs) * 2)
-                progress_ctx = ProgressContext(progress, task)
+                progress_ctx = ProgressContext(progress, task, PROGRESS_UPDATE_INTERVAL)
                 self._process_pairs_with_progress(livephoto_pairs, progress_ctx)
         else:
             self._process_pairs_with_progress(livephoto_pairs, progress_ctx)
 
-    def _resolve_basename_collision(self, shared_basename: str, creation_date,
-                                      image_file: Path, video_file: Path) -> str:
-        """Check for destination collisions and adjust shared basename if needed."""
-        year = f"{creation_date.year:04d}"
-        month = f"{creation_date.month:02d}"
-        dest_dir = self.dest / year / month
-
+    def _month_dir(self, creation_date: datetime) -> Path:
+        """Destination year/month folder for a creation date."""
+        return self.dest / f"{creation_date.year:04d}" / f"{creation_date.month:02d}"
+
+    @staticmethod
+    def _list_names(directory: Path) -> Set[str]:
+        """Return the entry names in a directory (empty if it doesn't exist yet)."""
+        try:
+            with os.scandir(directory) as entries:
+                return {entry.name for entry in entries}
+        except FileNotFoundError:
+            return set()
+
+    def _resolve_basename_collision(self, shared_basename: str, dest_dir: Path,
+                                      image_file: Path, video_file: Path,
+                                      existing: Set[str],
+                                      image_size: Optional[int] = None,
+                                      video_size: Optional[int] = None) -> str:
+        """Check for destination collisions and adjust shared basename if needed.
+
+        Candidate names are tested against existing, the set of names in
+        dest_dir, instead of stat'ing each one; the names chosen are added.
+        """
         img_ext = self.file_ops.normalize_jpg_extension(image_file.suffix.lower())
         vid_ext = video_file.suffix.lower()
 
-        img_dest = dest_dir / f"{shared_basename}{img_ext}"
-        vid_dest = dest_dir / f"{shared_basename}{vid_ext}"
+        img_name = f"{shared_basename}{img_ext}"
+        vid_name = f"{shared_basename}{vid_ext}"
 
         collision_suffix = 0
-        while img_dest.exists() or vid_dest.exists():
-            # Only treat as duplicate pair if both sides match
-            img_is_dupe = img_dest.exists() and self.file_ops.is_duplicate(image_file, img_dest)
-            vid_is_dupe = vid_dest.exists() and self.file_ops.is_duplicate(video_file, vid_dest)
-            if img_is_dupe and (vid_is_dupe or not vid_dest.exists()):
+        adjusted = shared_basename
+        while True:
+            img_exists = img_name in existing
+            vid_exists = vid_name in existing
+            if not (img_exists or vid_exists):
+                break
+
+            # Only treat as duplicate pair if both sides match (checked against the real files)
+            img_is_dupe = img_exists and self.file_ops.is_duplicate(
+                image_file, dest_dir / img_name, source_size=image_size)
+            vid_is_dupe = vid_exists and self.file_ops.is_duplicate(
+                video_file, dest_dir / vid_name, source_size=video_size)
+            if img_is_dupe and (vid_is_dupe or not vid_exists):
                 break
             collision_suffix += 1
             adjusted = f"{shared_basename}_{collision_suffix:02d}"
-            img_dest = dest_dir / f"{adjusted}{img_ext}"
-            vid_dest = dest_dir / f"{adjusted}{vid_ext}"
+            img_name = f"{adjusted}{img_ext}"
+            vid_name = f"{adjusted}{vid_ext}"
+
+        # Later pairs in this folder must see the names claimed here
+        existing.add(img_name)
+        existing.add(vid_name)
 
         if collision_suffix > 0:
-            adjusted_basename = f"{shared_basename}_{collision_suffix:02d}"
-            self.logger.info(f"LP basename collision resolved: {shared_basename} -> {adjusted_basename}")
-            return adjusted_basename
+            self.logger.info(f"LP basename collision resolved: {shared_basename} -> {adjusted}")
 
-        return shared_basename
+        return adjusted
 
     def _process_pairs_with_progress(self, livephoto_pairs: Dict[str, Dict], progress_ctx) -> None:
-        """Internal method to process pairs with a given progress context."""
+        """Internal method to process pairs concurrently with a given progress context."""
         # Sort pairs by image filename for deterministic processing order
         sorted_pairs = sorted(livephoto_pairs.items(), key=lambda x: str(x[1]['image_file']))
+
+        # Pairs sharing a basename compete for the same destination names, so
+        # each group is processed sequentially by a single worker
+        basename_groups = {}
         for pair_id, pair_data in sorted_pairs:
+            basename_groups.setdefault(pair_data['shared_basename'], []).append((pair_id, pair_data))
+
+        # List each destination folder once up front; collision checks test
+        # names against these sets rather than stat'ing every candidate
+        dest_names = {}
+        for _, pair_data in sorted_pairs:
+            dest_dir = self._month_dir(pair_data['creation_date'])
+            if dest_dir not in dest_names:
+                dest_names[dest_dir] = self._list_names(dest_dir)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._process_pair_group, group, progress_ctx, dest_names)
+                       for group in basename_groups.values()]
             try:
-                image_file = pair_data['image_file']
-                video_file = pair_data['video_file']
-                shared_basename = pair_data['shared_basename']
-                creation_date = pair_data['creation_date']
-
-                # Capture file sizes before processing (files may be moved)
-                image_size = image_file.stat().st_size
-                video_size = video_file.stat().st_size
-
-                # Resolve basename collisions at destination
-                shared_basename = self._resolve_basename_collision(
-                    shared_basename, creation_date, image_file, video_file
-                )
-
-                # Process image file with shared basename
-                success_image = self._process_livephoto_file(
-                    image_file, shared_basename, creation_date, progress_ctx
-                )
-
-                # Process video file with shared basename
-                success_video = self._process_livephoto_file(
-                    video_file, shared_basename, creation_date, progress_ctx
-                )
-
-                lp_size = image_size + video_size
-
-                if success_image and success_video:
-                    self.stats_manager.increment_livephoto_pairs()
-                    self.stats_manager.add_file_size(lp_size)
-                    self.logger.debug(f"Successfully processed Live Photo pair: {image_file.name} + {video_file.name}")
-                else:
-                    self.logger.error(f"Failed to process Live Photo pair: {image_file.name} + {video_file.name}")
-                    if success_image:
-                        self.stats_manager.record_successful_file(image_file, image_size)
-                    if success_video:
-                        self.stats_manager.record_successful_file(video_file, video_size)
+                # Workers report their file count and tallies; both are applied here
+                for future in as_completed(futures):
+                    file_count, group_stats = future.result()
+                    self.stats_manager.merge(group_stats)
+                    progress_ctx.advance(file_count)
+            except BaseException:
+                # Don't drain the queue of pending pairs on error or interrupt
+                for future in futures:
+                    future.cancel()
+                raise
+
+        progress_ctx.flush()
+
+    def _process_pair_group(self, group: List[Tuple[str, Dict]], progress_ctx,
+                            dest_names: Dict[Path, Set[str]]) -> Tuple[int, StatsManager]:
+        """Process a group of pairs sharing a basename in order.
+
+        Returns the file count and the group's statistics, tallied privately
+        so workers don't contend for the shared StatsManager.
+        """
+        stats = StatsManager()
+        for pair_id, pair_data in group:
+            self._process_single_pair(pair_id, pair_data, progress_ctx, stats, dest_names)
+        return 2 * len(group), stats
+
+    def _process_single_pair(self, pair_id: str, pair_data: Dict, progress_ctx,
+                             stats: StatsManager, dest_names: Dict[Path, Set[str]]) -> None:
+        """Process both files of a single Live Photo pair."""
+        try:
+            image_file = pair_data['image_file']
+            video_file = pair_data['video_file']
+            shared_basename = pair_data['shared_basename']
+            creation_date = pair_data['creation_date']
+
+            # Capture file sizes before processing (files may be moved)
+            image_size = image_file.stat().st_size
+            video_size = video_file.stat().st_size
+
+            # Both files land in the same year/month folder (created up front)
+            dest_dir = self._month_dir(creation_date)
+
+            # Resolve basename collisions at destination
+            shared_basename = self._resolve_basename_collision(
+                shared_basename, dest_dir, image_file, video_file,
+                dest_names[dest_dir], image_size, video_size
+            )
+
+            # Process image file with shared basename
+            success_image = self._process_livephoto_file(
+                image_file, shared_basename, dest_dir, progress_ctx, stats, image_size
+            )
 
-            except Exception as e:
-                self.logger.error(f"Error processing Live Photo pair {pair_id}: {e}")
-                for which in ['image_file', 'video_file']:
-                    if self.file_ops.archive_file(pair_data[which], self.unsorted_dir):
-                        self.stats_manager.increment_unsorted()
+            # Process video file with shared basename
+            success_video = self._process_livephoto_file(
+                video_file, shared_basename, dest_dir, progress_ctx, stats, video_size
+            )
+
+            lp_size = image_size + video_size
 
-            progress_ctx.advance(2)
+            if success_image and success_video:
+                stats.increment_livephoto_pairs()
+                stats.add_file_size(lp_size)
+                self.logger.debug(f"Successfully processed Live Photo pair: {image_file.name} + {video_file.name}")
+            else:
+                self.logger.error(f"Failed to process Live Photo pair: {image_file.name} + {video_file.name}")
+                if success_image:
+                    stats.record_successful_file(image_file, image_size)
+                if success_video:
+                    stats.record_successful_file(video_file, video_size)
+
+        except Exception as e:
+            self.logger.error(f"Error processing Live Photo pair {pair_id}: {e}")
+            for which in ['image_file', 'video_file']:
+                if self.file_ops.archive_file(pair_data[which], self.unsorted_dir):
+                    stats.increment_unsorted()
 
     def _process_livephoto_file(self, file_path: Path, shared_basename: str,
-                                creation_date: datetime, progress_ctx: ProgressContext) -> bool:
+                                dest_dir: Path, progress_ctx: ProgressContext, stats: StatsManager,
+                                file_size: Optional[int] = None) -> bool:
         """Process a single Live Photo file with predetermined basename."""
         # Handle video conversion if needed
         conversion = self.video_converter.handle_video_conversion(file_path, progress_ctx, "photosort_lp")
         if conversion.was_converted:
             if conversion.success:
-                self.stats_manager.increment_converted_videos()
+                stats.increment_converted_videos()
             else:
                 # Fall back to the original source video file
                 self.logger.warning(f"Processing original Live Photo video file: {conversion.source_file}")
                 conversion.processing_file = conversion.source_file
 
-        # Generate destination path using shared basename
-        year = f"{creation_date.year:04d}"
-        month = f"{creation_date.month:02d}"
-        dest_dir = self.dest / year / month
-        ext = conversion.processing_file.suffix.lower()
-        ext = self.file_ops.normalize_jpg_extension(ext)
-        dest_path = dest_dir / f"{shared_basename}{ext}"
-
-        # Check for duplicate file at destination path
-        if self.file_ops.is_duplicate(conversion.processing_file, dest_path):
-            self.stats_manager.increment_duplicates()
-            progress_ctx.update(f"Skipping duplicate Live Photo: {conversion.processing_file.name}")
-            self.file_ops.delete_safely(conversion.source_file, conversion.temp_file)
-            return True
-
-        # Move processed file to destination
-        if self.file_ops.move_file_safely(conversion.processing_file, dest_path):
-            # If we converted a video, handle cleanup based on mode
-            if conversion.was_converted:
-                self.file_ops.archive_file(conversion.source_file, self.legacy_dir,
-                                           preserve_structure=True)
-                self.file_ops.delete_safely(conversion.temp_file)
-
-            # Update progress and return
-            progress_ctx.update(f"Processed Live Photo: {file_path.name}")
-            return True
-        else:
-            if self.file_ops.archive_file(file_path, self.unsorted_dir):
-                self.stats_manager.increment_unsorted()
+        # Temporary conversion output is removed on every exit path
+        try:
+            # Generate destination path using shared basename
+            ext = self.file_ops.normalize_jpg_extension(conversion.processing_file.suffix)
+            dest_path = dest_dir / f"{shared_basename}{ext}"
+
+            # Check for duplicate file at destination path (size known unless converted)
+            processing_size = None if conversion.processing_file != file_path else file_size
+            if self.file_ops.is_duplicate(conversion.processing_file, dest_path,
+                                          source_size=processing_size):
+                stats.increment_duplicates()
+                progress_ctx.update(f"Skipping duplicate Live Photo: {conversion.processing_file.name}")
+                self.file_ops.delete_safely(conversion.source_file)
+                return True
+
+            # Move processed file to destination
+            if self.file_ops.move_file_safely(conversion.processing_file, dest_path):
+                # If we converted a video, handle cleanup based on mode
+                if conversion.was_converted:
+                    self.file_ops.archive_file(conversion.source_file, self.legacy_dir,
+                                               preserve_structure=True)
+
+                # Update progress and return
+                progress_ctx.update(f"Processed Live Photo: {file_path.name}")
+                return True
+            else:
+                if self.file_ops.archive_file(file_path, self.unsorted_dir):
+                    stats.increment_unsorted()
+                return False
+        finally:
             self.file_ops.delete_safely(conversion.temp_file)
-            return False
-
@@ -1,15 +1,29 @@
 """Progress tracking context for photosort operations."""
 
+import threading
 from typing import Optional
 from rich.progress import Progress, TaskID
 
 
 class ProgressContext:
-    """Encapsulates progress tracking state for cleaner parameter passing."""
+    """Encapsulates progress tracking state for cleaner parameter passing.
+
+    Safe to share between worker threads: the batching counters are guarded
+    by a lock, as Rich guards its own task state.
+    """
+    
+    __slots__ = ('progress', 'task', 'update_interval', '_update_count',
+                 '_pending_steps', '_pending_description', '_lock')
     
-    def __init__(self, progress: Optional[Progress] = None, task: Optional[TaskID] = None):
+    def __init__(self, progress: Optional[Progress] = None, task: Optional[TaskID] = None,
+                 update_interval: int = 1):
         self.progress = progress
         self.task = task
+        self.update_interval = update_interval  # Forward every Nth description update and advance step
+        self._update_count = 0
+        self._pending_steps = 0
+        self._pending_description: Optional[str] = None
+        self._lock = threading.Lock()
     
     @property
     def is_active(self) -> bool:
@@ -17,11 +31,33 @@ class ProgressContext:
         return self.progress is not None and self.task is not None
     
     def update(self, description: str) -> None:
-        """Update progress description if tracking is active."""
+        """Update progress description if tracking is active, throttled by update_interval."""
         if self.is_active:
-            self.progress.update(self.task, description=description)
+            with self._lock:
+                self._update_count += 1
+                if self._update_count % self.update_interval == 0:
+                    self._pending_description = None
+                    self.progress.update(self.task, description=description)
+                else:
+                    # Keep the latest skipped description so flush() can show it
+                    self._pending_description = description
     
     def advance(self, steps: int = 1) -> None:
-        """Advance progress by given number of steps."""
+        """Advance progress by given number of steps, batched by update_interval."""
+        if self.is_active:
+            with self._lock:
+                self._pending_steps += steps
+                if self._pending_steps >= self.update_interval:
+                    self.progress.advance(self.task, self._pending_steps)
+                    self._pending_steps = 0
+    
+    def flush(self) -> None:
+        """Forward any batched progress steps and the latest skipped description."""
         if self.is_active:
-            self.progress.advance(self.task, steps)
\ No newline at end of file
+            with self._lock:
+                if self._pending_steps:
+                    self.progress.advance(self.task, self._pending_steps)
+                    self._pending_steps = 0
+                if self._pending_description is not None:
+                    self.progress.update(self.task, description=self._pending_description)
+                    self._pending_description = None
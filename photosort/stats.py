@@ -9,51 +9,51 @@ from .constants import MOVIE_EXTENSIONS
 
 
 class StatsManager:
-    """Encapsulates statistics tracking for photo sorting operations."""
+    """Encapsulates statistics tracking for photo sorting operations.
+    
+    Not thread-safe: concurrent workers tally into their own StatsManager,
+    which the main thread folds in with merge().
+    """
+    
+    # Counters live in slots rather than a dict: smaller instances, faster increments
+    __slots__ = ('_photos', '_videos', '_metadata', '_duplicates', '_unsorted',
+                 '_total_size', '_converted_videos', '_livephoto_pairs')
     
     def __init__(self):
-        self._stats = {
-            'photos': 0,
-            'videos': 0,
-            'metadata': 0,
-            'duplicates': 0,
-            'unsorted': 0,
-            'total_size': 0,
-            'converted_videos': 0,
-            'livephoto_pairs': 0
-        }
+        for name in self.__slots__:
+            setattr(self, name, 0)
     
     def increment_photos(self) -> None:
         """Increment photo count when a photo file is successfully processed."""
-        self._stats['photos'] += 1
+        self._photos += 1
     
     def increment_videos(self) -> None:
         """Increment video count when a video file is successfully processed."""
-        self._stats['videos'] += 1
+        self._videos += 1
     
     def increment_metadata(self) -> None:
         """Increment metadata count when a metadata file is successfully processed."""
-        self._stats['metadata'] += 1
+        self._metadata += 1
     
     def increment_duplicates(self) -> None:
         """Increment duplicate count when a duplicate file is detected and handled."""
-        self._stats['duplicates'] += 1
+        self._duplicates += 1
     
     def increment_unsorted(self, count: int = 1) -> None:
         """Increment unsorted count when file(s) fail processing and are archived."""
-        self._stats['unsorted'] += count
+        self._unsorted += count
     
     def increment_converted_videos(self) -> None:
         """Increment converted video count when a video conversion succeeds."""
-        self._stats['converted_videos'] += 1
+        self._converted_videos += 1
     
     def increment_livephoto_pairs(self) -> None:
         """Increment Live Photo pair count when a pair is successfully processed."""
-        self._stats['livephoto_pairs'] += 1
+        self._livephoto_pairs += 1
     
     def add_file_size(self, size: int) -> None:
         """Add file size to total when a file is successfully processed."""
-        self._stats['total_size'] += size
+        self._total_size += size
     
     def record_successful_file(self, file_path: Path, file_size: int) -> None:
         """Record a successfully processed file, updating both count and size.
@@ -67,43 +67,51 @@ class StatsManager:
             self.increment_photos()
         self.add_file_size(file_size)
     
+    def merge(self, other: "StatsManager") -> None:
+        """Add another manager's counts into this one.
+        
+        Lets workers tally into a private StatsManager and fold it in once.
+        """
+        for name in self.__slots__:
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+    
     def get_stats(self) -> Dict[str, int]:
         """Get a copy of current statistics."""
-        return self._stats.copy()
+        return {name[1:]: getattr(self, name) for name in self.__slots__}
     
     def get_total_files(self) -> int:
         """Get total count of successfully processed files."""
-        return self._stats['photos'] + self._stats['videos'] + self._stats['metadata']
+        return self._photos + self._videos + self._metadata
     
     def get_total_size_mb(self) -> float:
         """Get total size in megabytes."""
-        return self._stats['total_size'] / (1024 * 1024)
+        return self._total_size / (1024 * 1024)
     
     def has_errors(self) -> bool:
         """Check if any files were unsorted (had processing errors)."""
-        return self._stats['unsorted'] > 0
+        return self._unsorted > 0
     
     # Individual stat getters for reporting
     def get_photos(self) -> int:
-        return self._stats['photos']
+        return self._photos
     
     def get_videos(self) -> int:
-        return self._stats['videos']
+        return self._videos
     
     def get_metadata(self) -> int:
-        return self._stats['metadata']
+        return self._metadata
     
     def get_duplicates(self) -> int:
-        return self._stats['duplicates']
+        return self._duplicates
     
     def get_unsorted(self) -> int:
-        return self._stats['unsorted']
+        return self._unsorted
     
     def get_converted_videos(self) -> int:
-        return self._stats['converted_videos']
+        return self._converted_videos
     
     def get_livephoto_pairs(self) -> int:
-        return self._stats['livephoto_pairs']
+        return self._livephoto_pairs
     
     def get_total_size(self) -> int:
-        return self._stats['total_size']
\ No newline at end of file
+        return self._total_size
\ No newline at end of file
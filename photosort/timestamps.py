@@ -1,63 +1,155 @@
 """Shared functions for parsing date-time strings."""
 
-import json
 import logging
 import re
 import subprocess
 import zoneinfo
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rich.logging import RichHandler
 
 from .config import Config
 from .constants import (exiftool_available, ffprobe_available, get_console, get_logger,
-                        sips_available)
+                        json_loads, sips_available)
+from .exiftool import ExifToolDaemon, exiftool_json
 
 
 logger = get_logger()
 config_tz = Config().get_timezone() or 'America/New_York'
 
+# Original/creation date-time tags in priority order
+EXIF_DATE_FIELDS = (
+    'SubSecCreateDate',
+    'CreationDate',
+    'CreateDate',
+    'CreationTime',
+    'CreateTime',
+    'ProfileDateTime',
+    'DateTimeOriginal',
+)
+
+# Pattern handles ISO 8601 (dash dates, T separator) and
+# raw EXIF format (colon dates, space separator)
+ISO8601_RE = re.compile(
+    r'(\d{4}[-:]\d{2}[-:]\d{2})[T ](\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?')
+
+# exiftool arguments for reading image creation dates as ISO 8601 strings
+IMAGE_DATE_ARGS = ('-q', '-d', '%Y-%m-%dT%H:%M:%S%3f%z',
+                   *(f'-{field}' for field in EXIF_DATE_FIELDS))
+
+
+@lru_cache(maxsize=None)
+def default_timezone() -> zoneinfo.ZoneInfo:
+    """Return the configured default timezone, loaded once on first use."""
+    return zoneinfo.ZoneInfo(config_tz)
+
+
+@lru_cache(maxsize=64)
+def offset_timezone(offset: str) -> timezone:
+    """Return a fixed-offset timezone for an offset like "-0400" or "+05:00".
+
+    Memoized since a library typically spans only a handful of offsets.
+    """
+    # Hours and minutes sit at fixed positions with or without the colon
+    sign = 1 if offset[0] == '+' else -1
+    hours = int(offset[1:3])
+    minutes = int(offset[-2:])
+    return timezone(timedelta(minutes=sign * (hours * 60 + minutes)))
+
 
 def get_image_creation_date(image_path: Path) -> datetime:
-    """Get creation date for any image using exiftool, sips, or file stat."""
+    """Get creation date for any image using exiftool, sips, or file stat.
+
+    Results are memoized by path, size, and mtime, so an unchanged image is
+    only read once per run.
+    """
+    stat = image_path.stat()
+    return _cached_image_creation_date(str(image_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=8192)
+def _cached_image_creation_date(path: str, size: int, mtime_ns: int) -> datetime:
+    """Memoized image date read; size and mtime only serve as the cache key."""
+    return _read_image_creation_date(Path(path))
+
+
+def _read_image_creation_date(image_path: Path) -> datetime:
+    """Read an image's creation date using exiftool, sips, or file stat."""
     if exiftool_available:
         try:
-            # Call exiftool to retrieve creation timestamps
-            result = subprocess.run([
-                "exiftool",
-                "-q",
-                "-json",
-                "-d", "%Y-%m-%dT%H:%M:%S%3f%z",  # ISO 8601 compliant date-string
-                "-CreateDate",
-                "-CreationDate",
-                "-CreationTime",
-                "-SubSecCreateDate",
-                "-ProfileDateTime",
-                "-DateTimeOriginal",
-                str(image_path)],
-                capture_output=True, text=True, check=True
-            )
-
-            # Parse JSON output and process creation date tags in order
-            try:
-                exif_data = json.loads(result.stdout)[0]
-                creation_date = canonical_EXIF_date(exif_data)
-                if creation_date:
-                    return creation_date
-            except IndexError:
-                pass
+            # Call exiftool to retrieve creation timestamps as bare values, one
+            # line per requested tag in order ("-s3"), with "-" for missing tags ("-f")
+            result = subprocess.run(["exiftool", "-s3", "-f", *IMAGE_DATE_ARGS, str(image_path)],
+                                    stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+
+            # Process creation date tags in order, decoding only the tags present
+            values = result.stdout.splitlines()
+            exif_data = {field: value.decode('utf-8', 'replace')
+                         for field, value in zip(EXIF_DATE_FIELDS, values) if value != b'-'}
+            creation_date = canonical_EXIF_date(exif_data)
+            if creation_date:
+                return creation_date
 
         except subprocess.CalledProcessError:
             pass
 
+    return _fallback_creation_date(image_path)
+
+
+def get_image_creation_dates(image_paths: List[Path],
+                             daemon: Optional[ExifToolDaemon] = None) -> Dict[Path, datetime]:
+    """Get creation dates for many images with a single exiftool command.
+
+    Runs on the persistent daemon when one is given. Images exiftool can't
+    date fall back to sips or file stat, and images that can't be read at
+    all are left out of the result.
+    """
+    metadata_dates, fallback_dates = read_image_creation_dates(image_paths, daemon)
+    metadata_dates.update(fallback_dates)
+    return metadata_dates
+
+
+def read_image_creation_dates(image_paths: List[Path], daemon: Optional[ExifToolDaemon] = None
+                              ) -> Tuple[Dict[Path, datetime], Dict[Path, datetime]]:
+    """Get creation dates for many images, keeping exiftool and fallback dates apart.
+
+    Returns (metadata_dates, fallback_dates): dates exiftool read from the
+    images' metadata, and sips or file stat dates for the images it could not
+    date (all of them if exiftool is unavailable or fails).
+    """
+    dates = {}
+    if exiftool_available and image_paths:
+        by_source = {str(path): path for path in image_paths}
+        try:
+            for exif_data in exiftool_json([*IMAGE_DATE_ARGS, *by_source], daemon):
+                image_path = by_source.get(exif_data.get('SourceFile'))
+                creation_date = canonical_EXIF_date(exif_data)
+                if image_path is not None and creation_date:
+                    dates[image_path] = creation_date
+        except subprocess.CalledProcessError as e:
+            logger.debug(f"exiftool failed reading creation dates: {e}")
+
+    fallback_dates = {}
+    for image_path in image_paths:
+        if image_path not in dates:
+            try:
+                fallback_dates[image_path] = _fallback_creation_date(image_path)
+            except OSError as e:
+                logger.debug(f"Failed to get creation date for {image_path}: {e}")
+    return dates, fallback_dates
+
+
+def _fallback_creation_date(image_path: Path) -> datetime:
+    """Get creation date for an image without exiftool, using sips or file stat."""
     if sips_available:
         try:
             # Call sips tool to retrieve creation timestamps
             result = subprocess.run(
                 ["sips", "-g", "creation", str(image_path)],
-                capture_output=True, text=True, check=True
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True
             )
 
             # Parse sips output
@@ -65,7 +157,7 @@ def get_image_creation_date(image_path: Path) -> datetime:
                 if 'creation:' in line:
                     try:
                         date_str = line.split('creation: ')[1].strip()
-                        return datetime.strptime(date_str, "%Y:%m:%d %H:%M:%S")
+                        return parse_exif_datetime(date_str)
                     except ValueError:
                         break
 
@@ -76,23 +168,31 @@ def get_image_creation_date(image_path: Path) -> datetime:
     return datetime.fromtimestamp(image_path.stat().st_mtime)
 
 
+def parse_exif_datetime(date_str: str) -> datetime:
+    """Parse a fixed-width "YYYY:MM:DD HH:MM:SS" string by slicing (faster than strptime).
+
+    Raises ValueError for malformed input, like strptime.
+    """
+    if len(date_str) != 19 or date_str[10] != ' ':
+        raise ValueError(f"Invalid EXIF date-time: {date_str!r}")
+    return datetime(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+                    int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19]))
+
+
 def canonical_EXIF_date(dates: Dict[str, str]) -> Optional[datetime]:
     """Parse EXIF image creation date with millisecond precision, if available."""
     # Parse original/creation date-time tags in priority order
-    for date_field in ['SubSecCreateDate',
-                       'CreationDate',
-                       'CreateDate',
-                       'CreationTime',
-                       'CreateTime',
-                       'ProfileDateTime',
-                       'DateTimeOriginal']:
-        if date_field not in dates:
+    for date_field in EXIF_DATE_FIELDS:
+        date_str = dates.get(date_field)
+        if not date_str:
             continue
 
         try:
-            return parse_iso8601_datetime(dates[date_field])
+            creation_date = parse_iso8601_datetime(date_str)
         except ValueError:
             continue
+        if creation_date:
+            return creation_date
 
     return None
 
@@ -103,28 +203,39 @@ def parse_iso8601_datetime(timestamp_str: str) -> Optional[datetime]:
     Handles both ISO 8601 (2025-05-06T19:41:34-0400) and raw EXIF
     (2025:05:06 19:41:34.745-04:00) date formats.
     """
-    # Pattern handles ISO 8601 (dash dates, T separator) and
-    # raw EXIF format (colon dates, space separator)
-    pattern = r'(\d{4}[-:]\d{2}[-:]\d{2})[T ](\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?'
-    match = re.match(pattern, timestamp_str)
+    # Fast path: ISO 8601 strings are parsed in C by fromisoformat, which on
+    # Python 3.11+ also accepts "Z" and "-0400" offsets. EXIF colon dates are
+    # checked by position and given dashes first; anything fromisoformat
+    # rejects (trailing text, older Pythons) falls back to the regex
+    iso_str = timestamp_str
+    if len(iso_str) >= 19 and iso_str[4] == ':' and iso_str[7] == ':':
+        iso_str = f"{iso_str[0:4]}-{iso_str[5:7]}-{iso_str[8:]}"
+    if (len(iso_str) >= 19 and iso_str[4] == '-' and iso_str[7] == '-' and iso_str[10] in 'T '
+            and _iso_suffix_ok(iso_str[19:])):
+        try:
+            parsed_dt = datetime.fromisoformat(iso_str)
+        except ValueError:
+            pass
+        else:
+            if parsed_dt.tzinfo is None:
+                parsed_dt = parsed_dt.replace(tzinfo=timezone.utc)
+            local_dt = parsed_dt.astimezone(default_timezone()).replace(tzinfo=None)
+            # Keep the same millisecond precision as the regex path
+            return local_dt.replace(microsecond=local_dt.microsecond // 1000 * 1000)
+
+    match = ISO8601_RE.match(timestamp_str)
 
     if not match:
         return None
 
-    # Normalize colon-separated dates (EXIF format) to dash-separated
-    date_part = match.group(1).replace(':', '-')
-    time_part = match.group(2)
-    fractional_part = match.group(3)
-    timezone_part = match.group(4)
-
-    # Create base datetime string
-    datetime_str = f"{date_part} {time_part}"
-    if fractional_part:
-        milliseconds = fractional_part.ljust(3, '0')[:3]
-        datetime_str += f".{milliseconds}"
-        base_dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S.%f")
-    else:
-        base_dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M:%S")
+    date_part, time_part, fractional_part, timezone_part = match.groups()
+
+    # Build the datetime from the fixed-width fields directly (faster than strptime);
+    # fractional seconds are kept to millisecond precision
+    microseconds = int(fractional_part.ljust(3, '0')[:3]) * 1000 if fractional_part else 0
+    base_dt = datetime(int(date_part[0:4]), int(date_part[5:7]), int(date_part[8:10]),
+                       int(time_part[0:2]), int(time_part[3:5]), int(time_part[6:8]),
+                       microseconds)
 
     # Handle timezone
     if timezone_part:
@@ -132,37 +243,54 @@ def parse_iso8601_datetime(timestamp_str: str) -> Optional[datetime]:
             # UTC timezone
             aware_dt = base_dt.replace(tzinfo=timezone.utc)
         else:
-            # Parse offset like "-0400" or "+05:00"
-            tz_str = timezone_part
-            if ':' not in tz_str:
-                # Convert "-0400" to "-04:00"
-                tz_str = f"{tz_str[:-2]}:{tz_str[-2:]}"
-
-            # Parse the offset
-            sign = 1 if tz_str[0] == '+' else -1
-            hours = int(tz_str[1:3])
-            minutes = int(tz_str[4:6])
-            offset_minutes = sign * (hours * 60 + minutes)
-
-            tz_offset = timezone(timedelta(minutes=offset_minutes))
-            aware_dt = base_dt.replace(tzinfo=tz_offset)
+            aware_dt = base_dt.replace(tzinfo=offset_timezone(timezone_part))
     else:
         # No timezone info, assume UTC
         aware_dt = base_dt.replace(tzinfo=timezone.utc)
 
     # Convert to configured default timezone
-    dflt_tz = zoneinfo.ZoneInfo(config_tz)
-    tz_dt = aware_dt.astimezone(dflt_tz)
+    tz_dt = aware_dt.astimezone(default_timezone())
 
     # Return as naive datetime in default timezone for consistency
     return tz_dt.replace(tzinfo=None)
 
 
+def _iso_suffix_ok(suffix: str) -> bool:
+    """Check that the text after the seconds is one the regex reads the same way.
+
+    fromisoformat also accepts offsets like "+05" and "+05:30:00" and a bare
+    "." before the offset, which the regex would read differently.
+    """
+    if suffix[:1] == '.' and not suffix[1:2].isdigit():
+        return False
+    offset = suffix.lstrip('.0123456789')
+    return offset in ('', 'Z') or (len(offset) in (5, 6) and offset[0] in '+-')
+
+
 def get_video_creation_date(file_path: Path) -> Optional[datetime]:
-    """Extract creation date from video metadata with Apple QuickTime priority."""
+    """Extract creation date from video metadata with Apple QuickTime priority.
+
+    Results are memoized by path, size, and mtime, like get_image_creation_date.
+    """
     if not ffprobe_available:
         return None
 
+    try:
+        stat = file_path.stat()
+    except OSError as e:
+        logger.debug(f"Cannot read video file {file_path}: {e}")
+        return None
+    return _cached_video_creation_date(str(file_path), stat.st_size, stat.st_mtime_ns)
+
+
+@lru_cache(maxsize=8192)
+def _cached_video_creation_date(path: str, size: int, mtime_ns: int) -> Optional[datetime]:
+    """Memoized video date read; size and mtime only serve as the cache key."""
+    return _read_video_creation_date(Path(path))
+
+
+def _read_video_creation_date(file_path: Path) -> Optional[datetime]:
+    """Read a video's creation date with ffprobe."""
     try:
         # Use ffprobe to get format metadata as JSON
         result = subprocess.run([
@@ -170,10 +298,14 @@ def get_video_creation_date(file_path: Path) -> Optional[datetime]:
             "-print_format", "json",
             "-show_format",
             str(file_path)
-        ], capture_output=True, text=True, check=True)
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
 
-        # Parse JSON output
-        data = json.loads(result.stdout)
+        # Parse JSON output (raw UTF-8 bytes)
+        try:
+            data = json_loads(result.stdout)
+        except ValueError as e:  # json and orjson decode errors both subclass ValueError
+            logger.debug(f"Failed to parse ffprobe JSON output for {file_path}: {e}")
+            return None
         tags = data.get("format", {}).get("tags", {})
 
         if not tags:
@@ -195,9 +327,6 @@ def get_video_creation_date(file_path: Path) -> Optional[datetime]:
     except subprocess.CalledProcessError as e:
         logger.debug(f"ffprobe failed for {file_path}: {e}")
         return None
-    except json.JSONDecodeError as e:
-        logger.debug(f"Failed to parse ffprobe JSON output for {file_path}: {e}")
-        return None
     except Exception as e:
         logger.debug(f"Error parsing video creation date for {file_path}: {e}")
         return None
@@ -1,57 +1,184 @@
 #!/usr/bin/env python3
 """Convert videos to x265/HEVC format using ffmpeg."""
 
+import argparse
+import os
 import sys
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
+VIDEO_EXTENSIONS = {".avi", ".m4v", ".mkv", ".mov", ".mp4", ".mpg", ".mts", ".wmv"}
+THREADS_PER_JOB = 4  # Encoder threads per ffmpeg process in batch mode
 
-def convert_video(input_path: Path, output_path: Path) -> bool:
-    """Convert the video using ffmpeg."""
-    cmd = [
-        "ffmpeg", "-i", str(input_path),
-        "-c:v", "libx265",          # H.265 video codec
-        "-c:a", "aac",              # AAC audio codec
-        "-preset", "medium",        # Encoding speed/quality balance
-        "-movflags", "+faststart+use_metadata_tags",  # Streaming + Apple metadata
-        "-map_metadata", "0:g",     # Global metadata only
-        "-pix_fmt", "yuv420p",      # QuickTime/macOS compatibility
-        "-crf", "23",               # Quality setting (lower = better quality)
-        "-tag:v", "hvc1",           # Correct fourCC code for H.265/MP4
-        "-y",                       # Overwrite output
-        str(output_path)
-    ]
+# Encoder defaults: libx265 preset and CRF (lower = better), VideoToolbox quality (higher = better)
+DEFAULT_PRESET = "medium"
+DEFAULT_CRF = 23
+DEFAULT_QUALITY = 50
+
+
+@lru_cache(maxsize=None)
+def hardware_encoder_available() -> bool:
+    """Check whether ffmpeg has the VideoToolbox hardware HEVC encoder (macOS)."""
+    try:
+        result = subprocess.run(["ffmpeg", "-hide_banner", "-encoders"],
+                                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    except OSError:
+        return False
+    return b"hevc_videotoolbox" in result.stdout
+
+
+def convert_video(input_path: Path, output_path: Path, threads: Optional[int] = None,
+                  preset: Optional[str] = None, crf: Optional[int] = None,
+                  quality: Optional[int] = None,
+                  hardware: Optional[bool] = None) -> subprocess.CompletedProcess:
+    """Convert the video using ffmpeg, optionally capping its encoder threads.
+
+    Uses the hardware HEVC encoder when ffmpeg has one (unless hardware is
+    False or a libx265 preset or CRF is given), which is much faster than
+    libx265 at similar quality. Raises ValueError if options are given for
+    the encoder that is not used.
+    """
+    if hardware is None:
+        hardware = preset is None and crf is None and hardware_encoder_available()
+
+    if hardware:
+        if preset is not None or crf is not None:
+            raise ValueError("preset and crf apply only to the libx265 software encoder")
+        cmd = [
+            "ffmpeg", "-i", str(input_path),
+            "-c:v", "hevc_videotoolbox",  # Apple hardware H.265 encoder
+            "-q:v", str(DEFAULT_QUALITY if quality is None else quality),  # Higher = better quality
+            "-tag:v", "hvc1",           # Correct fourCC code for H.265/MP4
+            "-c:a", "aac",              # AAC audio codec
+            "-movflags", "+faststart+use_metadata_tags",  # Streaming + Apple metadata
+            "-map_metadata", "0:g",     # Global metadata only
+            "-pix_fmt", "yuv420p",      # QuickTime/macOS compatibility
+            "-y",                       # Overwrite output
+            str(output_path)
+        ]
+    else:
+        if quality is not None:
+            raise ValueError("quality applies only to the hardware encoder")
+        cmd = [
+            "ffmpeg", "-i", str(input_path),
+            "-c:v", "libx265",          # H.265 video codec
+            "-c:a", "aac",              # AAC audio codec
+            "-preset", preset or DEFAULT_PRESET,  # Encoding speed/quality balance
+            "-movflags", "+faststart+use_metadata_tags",  # Streaming + Apple metadata
+            "-map_metadata", "0:g",     # Global metadata only
+            "-pix_fmt", "yuv420p",      # QuickTime/macOS compatibility
+            "-crf", str(DEFAULT_CRF if crf is None else crf),  # Lower = better quality
+            "-tag:v", "hvc1",           # Correct fourCC code for H.265/MP4
+            "-y",                       # Overwrite output
+            str(output_path)
+        ]
+
+    if threads:
+        cmd[-2:-2] = ["-threads", str(threads)]
 
     # Run conversion
     return subprocess.run(cmd, capture_output=True)
 
 
-def main() -> int:
-    if len(sys.argv) < 3:
-        print(f"Usage: {sys.argv[0]} <input_path> <output_path>")
+def report(input_path: Path, output_path: Path, result: subprocess.CompletedProcess) -> None:
+    """Print the outcome of one conversion."""
+    if result.returncode == 0:
+        print(f"Conversion successful: {output_path}")
+    else:
+        print(f"Error: ffmpeg call failed for {input_path}:")
+        print(result.stderr.decode("utf-8", "replace"))
+
+
+def convert_directory(input_dir: Path, output_dir: Path, threads: int = THREADS_PER_JOB,
+                      **options) -> int:
+    """Convert every video in input_dir into output_dir, several files at a time.
+
+    Each job runs its own ffmpeg process with a capped thread count, so the
+    jobs share the cores instead of oversubscribing them. Other options are
+    passed to convert_video.
+    """
+    videos = sorted(p for p in input_dir.iterdir()
+                    if p.is_file() and p.suffix.lower() in VIDEO_EXTENSIONS)
+    if not videos:
+        print(f"Error: no videos found in {input_dir}")
         return 1
 
-    input_path = Path(str(sys.argv[1])).expanduser().resolve()
-    output_path = Path(str(sys.argv[2])).expanduser().resolve()
+    jobs = max(1, (os.cpu_count() or 1) // threads)
+    pairs = [(video, output_dir / f"{video.stem}.mp4") for video in videos]
+
+    def run(pair):
+        try:
+            return convert_video(*pair, threads=threads, **options)
+        except OSError as e:
+            return subprocess.CompletedProcess([], 1, b"", str(e).encode())
+
+    failures = 0
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        for (input_path, output_path), result in zip(pairs, executor.map(run, pairs)):
+            report(input_path, output_path, result)
+            failures += result.returncode != 0
+
+    return 1 if failures else 0
+
+
+def positive_int(value: str) -> int:
+    """Parse a positive integer command-line value."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer: {value}")
+    return number
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Convert a video, or every video in a directory, to HEVC/MP4.")
+    parser.add_argument("input_path", help="Input video file or directory")
+    parser.add_argument("output_path", help="Output file, or output directory for a directory input")
+    parser.add_argument("--software", action="store_true",
+                        help="Encode with libx265 even if the hardware encoder is available")
+    parser.add_argument("--preset", help=f"libx265 preset (default: {DEFAULT_PRESET}; implies --software)")
+    parser.add_argument("--crf", type=int, help=f"libx265 CRF, lower is better (default: {DEFAULT_CRF}; "
+                                                "implies --software)")
+    parser.add_argument("--quality", type=int,
+                        help=f"Hardware encoder quality, higher is better (default: {DEFAULT_QUALITY})")
+    parser.add_argument("--threads", type=positive_int,
+                        help=f"Encoder threads per ffmpeg process (default: {THREADS_PER_JOB} "
+                             "for directories, ffmpeg's choice for a single file)")
+    args = parser.parse_args()
+
+    if args.quality is not None:
+        if args.software or args.preset is not None or args.crf is not None:
+            parser.error("--quality applies only to the hardware encoder")
+        if not hardware_encoder_available():
+            parser.error("--quality requires ffmpeg's hevc_videotoolbox hardware encoder")
+    options = {"preset": args.preset, "crf": args.crf, "quality": args.quality,
+               "hardware": False if args.software else None}
+
+    input_path = Path(args.input_path).expanduser().resolve()
+    output_path = Path(args.output_path).expanduser().resolve()
 
     if not input_path.exists():
         print(f"Error: missing input file: {input_path}")
         return 1
 
+    output_dir = output_path if input_path.is_dir() else output_path.parent
     try:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        output_dir.mkdir(parents=True, exist_ok=True)
     except IOError:
-        print(f"Error: invalid output path: {output_path.parent}")
+        print(f"Error: invalid output path: {output_dir}")
         return 1
 
+    if input_path.is_dir():
+        return convert_directory(input_path, output_path,
+                                 threads=args.threads or THREADS_PER_JOB, **options)
+
     result = None
     try:
-        result = convert_video(input_path, output_path)
-        if result.returncode == 0:
-            print(f"Conversion successful: {output_path}")
-        else:
-            print(f"Error: ffmpeg call failed:")
-            print(result.stderr.decode("utf-8"))
+        result = convert_video(input_path, output_path, threads=args.threads, **options)
+        report(input_path, output_path, result)
     except Exception as e:
         print(f"Error: video conversion failed:\n{e}")
 
@@ -3,12 +3,13 @@ pytest configuration and fixtures for photosort tests.
 """
 
 import io
+import os
 import shutil
 import sys
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Set
 
 import pytest
 
@@ -21,6 +22,62 @@ class CliResult:
     error: str
 
 
+MEDIA_EXTENSIONS = (".jpg", ".mp4", ".mov")
+
+
+def iter_files(root: Path) -> Iterator[os.DirEntry]:
+    """Yield entries for regular files under root in one os.scandir walk.
+
+    A missing root yields nothing, like Path.rglob.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+
+def has_extension(name: str, extensions: Iterable[str]) -> bool:
+    """Check a file name's lowercased extension against extensions."""
+    return os.path.splitext(name)[1].lower() in extensions
+
+
+def list_files(root: Path) -> List[Path]:
+    """Return the paths of all regular files under root."""
+    return [Path(entry.path) for entry in iter_files(root)]
+
+
+def iter_media_files(root: Path, extensions: Iterable[str] = MEDIA_EXTENSIONS) -> Iterator[os.DirEntry]:
+    """Yield entries for files under root whose extension is in extensions (any case)."""
+    return (entry for entry in iter_files(root) if has_extension(entry.name, extensions))
+
+
+def count_media_files(root: Path, extensions: Iterable[str] = MEDIA_EXTENSIONS) -> int:
+    """Count files under root whose extension is in extensions (any case)."""
+    return sum(1 for _ in iter_media_files(root, extensions))
+
+
+def find_media_files(root: Path, extensions: Iterable[str] = MEDIA_EXTENSIONS) -> List[Path]:
+    """Return files under root whose extension is in extensions (any case)."""
+    return [Path(entry.path) for entry in iter_media_files(root, extensions)]
+
+
+def has_media_files(root: Path, extensions: Iterable[str] = MEDIA_EXTENSIONS) -> bool:
+    """Check whether any file under root has an extension in extensions, stopping at the first."""
+    return next(iter_media_files(root, extensions), None) is not None
+
+
+def relative_file_set(root: Path) -> Set[str]:
+    """Return the paths of all files under root, relative to root."""
+    return {os.path.relpath(entry.path, root) for entry in iter_files(root)}
+
+
 @pytest.fixture(scope="session")
 def example_media_dir():
     """Path to the example media directory with real files.
@@ -45,6 +102,18 @@ def temp_source_folder(example_media_dir, tmp_path):
     return temp_source
 
 
+@pytest.fixture(scope="session")
+def shared_source_folder(example_media_dir, tmp_path_factory):
+    """One copy of example media shared by tests that never modify the source.
+
+    Only for dry runs and argument validation; tests that move, copy, or
+    clean up files must use temp_source_folder.
+    """
+    shared_source = tmp_path_factory.mktemp("shared") / "source"
+    shutil.copytree(example_media_dir, shared_source)
+    return shared_source
+
+
 @pytest.fixture(scope="session")
 def test_config_base(tmp_path_factory):
     """Shared test config directory for all tests."""
@@ -72,9 +141,14 @@ def test_config_path(test_config_base):
     return config_path
 
 
-@pytest.fixture
-def cli_runner(monkeypatch):
-    """Create a CLI runner that captures output and uses test config."""
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Create a CLI runner that captures output and uses test config.
+
+    The runner keeps no state between calls, so one is shared by all tests.
+    """
+    from photosort.cli import main
+    from photosort.constants import get_console
 
     def run_cli(*args, config_path=None):
         """Run photosort CLI with given arguments.
@@ -86,8 +160,6 @@ def cli_runner(monkeypatch):
         Returns:
             CliResult with exit_code, output, and error
         """
-        from photosort.cli import main
-
         # Capture stdout/stderr
         old_stdout = sys.stdout
         old_stderr = sys.stderr
@@ -109,7 +181,6 @@ def cli_runner(monkeypatch):
                 return "y"
             
             # Apply the mock
-            from photosort.constants import get_console
             console = get_console()
             original_input = getattr(console, 'input', None)
             console.input = mock_input
@@ -139,7 +210,6 @@ def cli_runner(monkeypatch):
             
             # Restore original console.input if it existed
             try:
-                from photosort.constants import get_console
                 console = get_console()
                 if original_input:
                     console.input = original_input
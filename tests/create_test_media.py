@@ -14,9 +14,12 @@ This script will:
 
 import argparse
 import json
+import os
 import shutil
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
@@ -24,9 +27,38 @@ from typing import Dict, List, Optional, Tuple
 # Add parent directory to path to import photosort modules
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from photosort.constants import PHOTO_EXTENSIONS, MOVIE_EXTENSIONS, METADATA_EXTENSIONS
+from photosort.constants import (LIVEPHOTO_IMAGE_EXTENSIONS, LIVEPHOTO_VIDEO_EXTENSIONS,
+                                 METADATA_EXTENSIONS, MOVIE_EXTENSIONS, PHOTO_EXTENSIONS)
 from photosort.file_operations import FileOperations
 
+# Selection priorities and limits per category
+PHOTO_PRIORITY_EXTS = ('.jpg', '.heic', '.cr2', '.nef', '.arw', '.png')
+VIDEO_PRIORITY_EXTS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.3gp')
+MAX_PRIORITY_PHOTOS = 5
+MAX_PHOTOS = 8
+MAX_VIDEOS = 4
+MAX_LIVEPHOTO_PAIRS = 3
+MAX_AAE_FILES = 3
+MAX_METADATA = 5
+COPY_WORKERS = 16  # Upper bound on concurrent file copies
+
+# Extension -> category, so each scanned file needs one lookup; photo types
+# take precedence over video and metadata types, as in the original checks
+EXT_CATEGORY = {
+    **{ext: 'metadata' for ext in METADATA_EXTENSIONS},
+    **{ext: 'video' for ext in MOVIE_EXTENSIONS},
+    **{ext: 'photo' for ext in PHOTO_EXTENSIONS},
+}
+
+
+@dataclass
+class MediaEntry:
+    """A scanned file with its stem and lowercased extension, split once by the scan."""
+    __slots__ = ('path', 'stem', 'ext')
+    path: Path
+    stem: str
+    ext: str
+
 
 class TestMediaCreator:
     """Creates a curated test media directory from user's media collection."""
@@ -34,7 +66,8 @@ class TestMediaCreator:
     def __init__(self, source_dir: Path, target_dir: Path):
         self.source_dir = source_dir
         self.target_dir = target_dir
-        self.file_ops = FileOperations(dry_run=False, move_files=False, mode=None, gid=None)
+        self.file_ops = FileOperations(dry_run=False, source=source_dir, move_files=False,
+                                       mode=None, gid=None)
         self.selected_files = {
             'photos': [],
             'videos': [],
@@ -43,42 +76,85 @@ class TestMediaCreator:
             'misc': []
         }
         self.report = []
+        # Misc candidates noted during the scan pass
+        self._ds_store: Optional[Path] = None
+        self._unknown_file: Optional[Path] = None
     
     def scan_for_suitable_files(self) -> None:
         """Scan source directory for files matching our test requirements."""
         print(f"Scanning {self.source_dir} for suitable test files...")
         
-        all_files = list(self.source_dir.rglob("*"))
-        print(f"Found {len(all_files)} total files")
-        
-        # Categorize files
-        photos = []
-        videos = []
+        # Categorize files in one scandir walk; the extension is checked on the
+        # bare name so only matching files are promoted to Path objects. Only the
+        # first photo and video of each type can be selected, while Live Photo
+        # candidates are all kept for basename matching
+        photos_by_ext: Dict[str, Path] = {}
+        videos_by_ext: Dict[str, Path] = {}
+        lp_photos = []
+        lp_videos = []
         metadata = []
-        
-        for file_path in all_files:
-            if not file_path.is_file():
-                continue
-                
-            ext = file_path.suffix.lower()
+        photo_count = video_count = total = 0
+        
+        # Live Photo basenames seen so far, to stop the walk once every category
+        # is satisfied
+        lp_photo_stems = set()
+        lp_video_stems = set()
+        lp_matches = set()
+        aae_count = 0
+        
+        for entry in self.file_ops.scan_files(self.source_dir):
+            total += 1
+            stem, ext = os.path.splitext(entry.name)
+            ext = ext.lower()
+            category = EXT_CATEGORY.get(ext)
+            
+            if category == 'photo':
+                photo_count += 1
+                if ext not in photos_by_ext:
+                    photos_by_ext[ext] = Path(entry.path)
+                if ext in LIVEPHOTO_IMAGE_EXTENSIONS:
+                    lp_photos.append(MediaEntry(Path(entry.path), stem, ext))
+                    lp_photo_stems.add(stem)
+                    if stem in lp_video_stems:
+                        lp_matches.add(stem)
+            elif category == 'video':
+                video_count += 1
+                if ext not in videos_by_ext:
+                    videos_by_ext[ext] = Path(entry.path)
+                if ext in LIVEPHOTO_VIDEO_EXTENSIONS:
+                    lp_videos.append(MediaEntry(Path(entry.path), stem, ext))
+                    lp_video_stems.add(stem)
+                    if stem in lp_photo_stems:
+                        lp_matches.add(stem)
+            elif category == 'metadata':
+                metadata.append(MediaEntry(Path(entry.path), stem, ext))
+                aae_count += ext == '.aae'
+            elif entry.name == '.DS_Store':
+                if self._ds_store is None:
+                    self._ds_store = Path(entry.path)
+            elif ext and self._unknown_file is None:
+                self._unknown_file = Path(entry.path)
             
-            if ext in PHOTO_EXTENSIONS:
-                photos.append(file_path)
-            elif ext in MOVIE_EXTENSIONS:
-                videos.append(file_path)
-            elif ext in METADATA_EXTENSIONS:
-                metadata.append(file_path)
+            if (self._ds_store is not None and self._unknown_file is not None
+                    and len(lp_matches) >= MAX_LIVEPHOTO_PAIRS
+                    and aae_count >= MAX_AAE_FILES and len(metadata) >= MAX_METADATA
+                    and (all(ext in photos_by_ext for ext in PHOTO_PRIORITY_EXTS)
+                         or len(photos_by_ext) >= MAX_PHOTOS)
+                    and sum(ext in videos_by_ext for ext in VIDEO_PRIORITY_EXTS) >= MAX_VIDEOS):
+                print("Found enough variety, stopping scan early")
+                break
         
-        print(f"Found {len(photos)} photos, {len(videos)} videos, {len(metadata)} metadata files")
+        print(f"Found {total} total files")
+        print(f"Found {photo_count} photos, {video_count} videos, {len(metadata)} metadata files")
         
         # Select diverse photos
-        self._select_photos(photos)
+        self._select_photos(photos_by_ext)
         
         # Select videos with different codecs
-        self._select_videos(videos)
+        self._select_videos(videos_by_ext)
         
         # Detect and select Live Photo pairs
-        self._select_livephotos(photos, videos)
+        self._select_livephotos(lp_photos, lp_videos)
         
         # Select metadata files
         self._select_metadata(metadata)
@@ -86,83 +162,57 @@ class TestMediaCreator:
         # Add misc files
         self._add_misc_files()
     
-    def _select_photos(self, photos: List[Path]) -> None:
-        """Select a diverse set of photos for testing."""
+    def _select_photos(self, photos_by_ext: Dict[str, Path]) -> None:
+        """Select a diverse set of photos for testing from the first photo of each type."""
         selected = []
         
-        # Group by extension
-        by_extension = {}
-        for photo in photos:
-            ext = photo.suffix.lower()
-            if ext not in by_extension:
-                by_extension[ext] = []
-            by_extension[ext].append(photo)
-        
         # Select at least one of each type, prioritizing variety
-        priority_exts = ['.jpg', '.heic', '.cr2', '.nef', '.arw', '.png']
-        
-        for ext in priority_exts:
-            if ext in by_extension and by_extension[ext]:
-                selected.append(by_extension[ext][0])
-                if len(selected) >= 5:  # Limit selection
+        for ext in PHOTO_PRIORITY_EXTS:
+            if ext in photos_by_ext:
+                selected.append(photos_by_ext[ext])
+                if len(selected) >= MAX_PRIORITY_PHOTOS:  # Limit selection
                     break
         
         # Add any remaining types
-        for ext, files in by_extension.items():
-            if ext not in priority_exts and files:
-                selected.append(files[0])
-                if len(selected) >= 8:
+        for ext, photo in photos_by_ext.items():
+            if ext not in PHOTO_PRIORITY_EXTS:
+                selected.append(photo)
+                if len(selected) >= MAX_PHOTOS:
                     break
         
-        self.selected_files['photos'] = selected[:8]
+        self.selected_files['photos'] = selected[:MAX_PHOTOS]
         self.report.append(f"Selected {len(self.selected_files['photos'])} photos")
     
-    def _select_videos(self, videos: List[Path]) -> None:
-        """Select videos with different codecs."""
+    def _select_videos(self, videos_by_ext: Dict[str, Path]) -> None:
+        """Select videos with different codecs from the first video of each type."""
         selected = []
         
-        # Group by extension as proxy for codec variety
-        by_extension = {}
-        for video in videos:
-            ext = video.suffix.lower()
-            if ext not in by_extension:
-                by_extension[ext] = []
-            by_extension[ext].append(video)
-        
-        # Priority order for codec variety
-        priority_exts = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.3gp']
-        
-        for ext in priority_exts:
-            if ext in by_extension and by_extension[ext]:
-                selected.append(by_extension[ext][0])
-                if len(selected) >= 4:
+        # Priority order for codec variety, with extension as proxy for codec
+        for ext in VIDEO_PRIORITY_EXTS:
+            if ext in videos_by_ext:
+                selected.append(videos_by_ext[ext])
+                if len(selected) >= MAX_VIDEOS:
                     break
         
-        self.selected_files['videos'] = selected[:4]
+        self.selected_files['videos'] = selected[:MAX_VIDEOS]
         self.report.append(f"Selected {len(self.selected_files['videos'])} videos")
     
-    def _select_livephotos(self, photos: List[Path], videos: List[Path]) -> None:
-        """Detect and select Live Photo pairs."""
+    def _select_livephotos(self, photos: List[MediaEntry], videos: List[MediaEntry]) -> None:
+        """Detect and select Live Photo pairs among Live Photo image and video candidates."""
         # Build basename maps
-        photo_map = {}
-        video_map = {}
-        
-        for photo in photos:
-            if photo.suffix.lower() in ('.jpg', '.jpeg', '.heic'):
-                basename = photo.stem
-                photo_map[basename] = photo
-        
-        for video in videos:
-            if video.suffix.lower() in ('.mov', '.mp4'):
-                basename = video.stem
-                video_map[basename] = video
+        photo_map = {photo.stem: photo.path for photo in photos}
+        video_map = {video.stem: video.path for video in videos}
         
-        # Find matching pairs
+        # Find matching pairs by probing the larger map with the smaller one's
+        # keys, stopping at the first few matches
+        smaller, larger = ((photo_map, video_map) if len(photo_map) <= len(video_map)
+                           else (video_map, photo_map))
         pairs = []
-        for basename in set(photo_map.keys()) & set(video_map.keys()):
-            pairs.append((photo_map[basename], video_map[basename]))
-            if len(pairs) >= 3:  # Limit to 3 pairs
-                break
+        for basename in smaller:
+            if basename in larger:
+                pairs.append((photo_map[basename], video_map[basename]))
+                if len(pairs) >= MAX_LIVEPHOTO_PAIRS:
+                    break
         
         # Flatten pairs for storage
         for photo, video in pairs:
@@ -170,20 +220,20 @@ class TestMediaCreator:
         
         self.report.append(f"Selected {len(pairs)} Live Photo pairs")
     
-    def _select_metadata(self, metadata: List[Path]) -> None:
+    def _select_metadata(self, metadata: List[MediaEntry]) -> None:
         """Select metadata files, prioritizing .aae files."""
         selected = []
         
         # Prioritize .aae files
-        aae_files = [f for f in metadata if f.suffix.lower() == '.aae']
-        other_metadata = [f for f in metadata if f.suffix.lower() != '.aae']
+        aae_files = [f.path for f in metadata if f.ext == '.aae']
+        other_metadata = [f.path for f in metadata if f.ext != '.aae']
         
         # Select up to 3 .aae files
-        selected.extend(aae_files[:3])
+        selected.extend(aae_files[:MAX_AAE_FILES])
         
         # Add other metadata types
         for file in other_metadata:
-            if len(selected) >= 5:
+            if len(selected) >= MAX_METADATA:
                 break
             selected.append(file)
         
@@ -191,25 +241,14 @@ class TestMediaCreator:
         self.report.append(f"Selected {len(self.selected_files['metadata'])} metadata files")
     
     def _add_misc_files(self) -> None:
-        """Add miscellaneous test files."""
-        # Look for .DS_Store files
-        ds_store_files = list(self.source_dir.rglob(".DS_Store"))
-        if ds_store_files:
-            self.selected_files['misc'].append(ds_store_files[0])
-        
-        # Look for any unknown extensions
-        all_files = list(self.source_dir.rglob("*"))
-        for file_path in all_files[:100]:  # Limit search
-            if not file_path.is_file():
-                continue
-            ext = file_path.suffix.lower()
-            if (ext and 
-                ext not in PHOTO_EXTENSIONS and 
-                ext not in MOVIE_EXTENSIONS and 
-                ext not in METADATA_EXTENSIONS and
-                ext != '.ds_store'):
-                self.selected_files['misc'].append(file_path)
-                break
+        """Add miscellaneous test files found during the scan."""
+        # First .DS_Store file
+        if self._ds_store is not None:
+            self.selected_files['misc'].append(self._ds_store)
+        
+        # First file with an unknown extension
+        if self._unknown_file is not None:
+            self.selected_files['misc'].append(self._unknown_file)
     
     def create_test_structure(self) -> None:
         """Create the test media directory structure."""
@@ -217,35 +256,36 @@ class TestMediaCreator:
         if self.target_dir.exists():
             shutil.rmtree(self.target_dir)
         
-        # Create subdirectories
-        (self.target_dir / "photos").mkdir(parents=True, exist_ok=True)
-        (self.target_dir / "videos").mkdir(parents=True, exist_ok=True)
-        (self.target_dir / "livephotos").mkdir(parents=True, exist_ok=True)
-        (self.target_dir / "metadata").mkdir(parents=True, exist_ok=True)
-        (self.target_dir / "misc").mkdir(parents=True, exist_ok=True)
+        # Create subdirectories; the target was just removed, so only its
+        # parents may already exist
+        self.target_dir.mkdir(parents=True)
+        for subdir in ("photos", "videos", "livephotos", "metadata", "misc"):
+            os.mkdir(self.target_dir / subdir)
     
     def copy_and_prepare_files(self) -> None:
         """Copy selected files and prepare test scenarios."""
         print("\nCopying selected files...")
         
+        # Plan every copy first as (source, dest, message) in report order; a
+        # None source is a heading with nothing to copy
+        plan: List[Tuple[Optional[Path], Optional[Path], Optional[str]]] = []
+        
         # Copy photos
         for i, photo in enumerate(self.selected_files['photos']):
             dest_name = f"photo_{i:03d}{photo.suffix}"
             dest_path = self.target_dir / "photos" / dest_name
-            shutil.copy2(photo, dest_path)
-            print(f"  Copied {photo.name} -> {dest_name}")
+            plan.append((photo, dest_path, f"  Copied {photo.name} -> {dest_name}"))
         
         # Create burst sequence from first 3 photos
         if len(self.selected_files['photos']) >= 3:
-            print("\nCreating burst sequence...")
+            plan.append((None, None, "\nCreating burst sequence..."))
             burst_time = datetime(2024, 1, 20, 12, 30, 45)
             for i in range(3):
                 src = self.selected_files['photos'][i]
                 dest_name = f"burst_{i+1:03d}{src.suffix}"
                 dest_path = self.target_dir / "photos" / dest_name
-                shutil.copy2(src, dest_path)
                 # Note: Setting EXIF dates requires exiftool or similar
-                print(f"  Created burst photo: {dest_name}")
+                plan.append((src, dest_path, f"  Created burst photo: {dest_name}"))
         
         # Copy videos
         for i, video in enumerate(self.selected_files['videos']):
@@ -261,8 +301,7 @@ class TestMediaCreator:
                 dest_name = f"video_{i:03d}{video.suffix}"
             
             dest_path = self.target_dir / "videos" / dest_name
-            shutil.copy2(video, dest_path)
-            print(f"  Copied {video.name} -> {dest_name}")
+            plan.append((video, dest_path, f"  Copied {video.name} -> {dest_name}"))
         
         # Copy Live Photo pairs
         pair_count = len(self.selected_files['livephotos']) // 2
@@ -273,29 +312,43 @@ class TestMediaCreator:
             photo_dest = self.target_dir / "livephotos" / f"LP_{i+1:03d}{photo.suffix}"
             video_dest = self.target_dir / "livephotos" / f"LP_{i+1:03d}{video.suffix}"
             
-            shutil.copy2(photo, photo_dest)
-            shutil.copy2(video, video_dest)
-            print(f"  Copied Live Photo pair: LP_{i+1:03d}")
+            plan.append((photo, photo_dest, None))
+            plan.append((video, video_dest, f"  Copied Live Photo pair: LP_{i+1:03d}"))
         
         # Copy metadata files
         for i, metadata in enumerate(self.selected_files['metadata']):
             dest_path = self.target_dir / "metadata" / metadata.name
-            shutil.copy2(metadata, dest_path)
-            print(f"  Copied metadata: {metadata.name}")
+            plan.append((metadata, dest_path, f"  Copied metadata: {metadata.name}"))
         
         # Copy misc files
         for misc in self.selected_files['misc']:
             dest_path = self.target_dir / "misc" / misc.name
-            shutil.copy2(misc, dest_path)
-            print(f"  Copied misc: {misc.name}")
+            plan.append((misc, dest_path, f"  Copied misc: {misc.name}"))
         
         # Create a file without EXIF (if we have photos)
         if self.selected_files['photos']:
             src = self.selected_files['photos'][0]
             no_exif_path = self.target_dir / "photos" / f"no_exif{src.suffix}"
-            shutil.copy2(src, no_exif_path)
             # Note: Stripping EXIF requires additional tools
-            print(f"  Created no_exif{src.suffix} (EXIF stripping requires exiftool)")
+            plan.append((src, no_exif_path,
+                         f"  Created no_exif{src.suffix} (EXIF stripping requires exiftool)"))
+        
+        # Copies are I/O-bound, so overlap them on threads; map() keeps the
+        # messages in plan order. Only the data and timestamps are copied (the
+        # mtime is photosort's last-resort date), skipping copy2's mode, flag
+        # and xattr syscalls
+        def copy(item):
+            src, dest, _ = item
+            if src is not None:
+                st = os.stat(src)
+                shutil.copyfile(src, dest)
+                os.utime(dest, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        workers = min(COPY_WORKERS, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for (_, _, message), _ in zip(plan, executor.map(copy, plan)):
+                if message:
+                    print(message)
     
     def generate_documentation(self) -> None:
         """Generate README documenting the test files."""
@@ -341,8 +394,7 @@ class TestMediaCreator:
         content.append("- no_exif.* needs EXIF data stripped\n")
         content.append("- Use exiftool to verify/modify metadata as needed\n")
         
-        with open(readme_path, 'w') as f:
-            f.writelines(content)
+        readme_path.write_text("".join(content), encoding='utf-8')
         
         print(f"\nGenerated {readme_path}")
     
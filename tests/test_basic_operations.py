@@ -5,6 +5,8 @@ Test basic photosort operations: move, copy, dry-run, and validation.
 import pytest
 from pathlib import Path
 
+from .conftest import count_media_files, has_media_files, relative_file_set
+
 
 class TestBasicOperations:
     """Test fundamental photosort operations."""
@@ -16,10 +18,7 @@ class TestBasicOperations:
         dest_path = test_config_path.parent / dest_name
         
         # Count source files before operation
-        source_media_files = list(temp_source_folder.rglob("*.jpg")) + \
-                            list(temp_source_folder.rglob("*.mp4")) + \
-                            list(temp_source_folder.rglob("*.mov"))
-        initial_count = len(source_media_files)
+        initial_count = count_media_files(temp_source_folder)
         
         # Run photosort in move mode (default)
         result = cli_runner(
@@ -33,16 +32,10 @@ class TestBasicOperations:
         assert "Processing completed successfully" in result.output
         
         # Verify files were moved (source should be empty of media files)
-        remaining_media = list(temp_source_folder.rglob("*.jpg")) + \
-                         list(temp_source_folder.rglob("*.mp4")) + \
-                         list(temp_source_folder.rglob("*.mov"))
-        assert len(remaining_media) == 0, "Source should be empty after move"
+        assert not has_media_files(temp_source_folder), "Source should be empty after move"
         
         # Verify destination has files
-        dest_media = list(dest_path.rglob("*.jpg")) + \
-                    list(dest_path.rglob("*.mp4")) + \
-                    list(dest_path.rglob("*.mov"))
-        assert len(dest_media) > 0, "Destination should have files"
+        assert has_media_files(dest_path), "Destination should have files"
         
         # Verify history folder created
         assert_history_structure(test_config_path, dest_name)
@@ -53,8 +46,7 @@ class TestBasicOperations:
         dest_path = test_config_path.parent / dest_name
         
         # Count source files
-        source_photos = list(temp_source_folder.rglob("*.jpg"))
-        initial_count = len(source_photos)
+        initial_count = count_media_files(temp_source_folder, (".jpg",))
         
         # Run photosort in copy mode
         result = cli_runner(
@@ -69,26 +61,24 @@ class TestBasicOperations:
         assert "Processing completed successfully" in result.output
         
         # Verify files still exist in source
-        remaining_photos = list(temp_source_folder.rglob("*.jpg"))
-        assert len(remaining_photos) == initial_count, \
+        remaining_count = count_media_files(temp_source_folder, (".jpg",))
+        assert remaining_count == initial_count, \
             "Source files should remain in copy mode"
         
         # Verify files copied to destination
-        dest_photos = list(dest_path.rglob("*.jpg"))
-        assert len(dest_photos) > 0, "Files should be copied to destination"
+        assert has_media_files(dest_path, (".jpg",)), "Files should be copied to destination"
     
-    def test_dry_run_mode(self, cli_runner, temp_source_folder, test_config_path):
+    def test_dry_run_mode(self, cli_runner, shared_source_folder, test_config_path):
         """Test dry-run mode doesn't modify files."""
         dest_name = "test_dry_run_dest"
         dest_path = test_config_path.parent / dest_name
         
         # Get initial file state
-        source_files_before = set(f.relative_to(temp_source_folder) 
-                                 for f in temp_source_folder.rglob("*") if f.is_file())
+        source_files_before = relative_file_set(shared_source_folder)
         
         # Run photosort in dry-run mode
         result = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(dest_path),
             "--dry-run",
             config_path=test_config_path
@@ -99,8 +89,7 @@ class TestBasicOperations:
         assert result.exit_code == 0
         
         # Verify no files were moved
-        source_files_after = set(f.relative_to(temp_source_folder) 
-                                for f in temp_source_folder.rglob("*") if f.is_file())
+        source_files_after = relative_file_set(shared_source_folder)
         assert source_files_before == source_files_after, \
             "Source files should not change in dry-run mode"
         
@@ -132,12 +121,12 @@ class TestBasicOperations:
         assert result.exit_code == 1
         assert "Source is not a directory" in result.output
     
-    def test_source_dest_validation(self, cli_runner, temp_source_folder, test_config_path):
+    def test_source_dest_validation(self, cli_runner, shared_source_folder, test_config_path):
         """Test source/destination path validation."""
         # Test same source and destination
         result = cli_runner(
-            str(temp_source_folder),
-            str(temp_source_folder),
+            str(shared_source_folder),
+            str(shared_source_folder),
             config_path=test_config_path
         )
         
@@ -145,9 +134,9 @@ class TestBasicOperations:
         assert "Identical or overlapping source/dest folders" in result.output
         
         # Test destination inside source
-        nested_dest = temp_source_folder / "organized"
+        nested_dest = shared_source_folder / "organized"
         result = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(nested_dest),
             config_path=test_config_path
         )
@@ -156,9 +145,9 @@ class TestBasicOperations:
         assert "Identical or overlapping source/dest folders" in result.output
         
         # Test source inside destination
-        parent_dest = temp_source_folder.parent
+        parent_dest = shared_source_folder.parent
         result = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(parent_dest),
             config_path=test_config_path
         )
@@ -181,13 +170,13 @@ class TestBasicOperations:
         assert result.exit_code == 0
         assert "No media files found in source directory" in result.output
     
-    def test_verbose_mode(self, cli_runner, temp_source_folder, test_config_path):
+    def test_verbose_mode(self, cli_runner, shared_source_folder, test_config_path):
         """Test verbose logging mode."""
         dest_path = test_config_path.parent / "test_verbose_dest"
         
         # Run with verbose flag
         result = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(dest_path),
             "--verbose",
             "--dry-run",  # Use dry-run to avoid file operations
@@ -198,13 +187,13 @@ class TestBasicOperations:
         # Verbose mode should show more detailed output
         # (specific assertions depend on what verbose logging includes)
     
-    def test_mixed_flags(self, cli_runner, temp_source_folder, test_config_path):
+    def test_mixed_flags(self, cli_runner, shared_source_folder, test_config_path):
         """Test combination of flags."""
         dest_path = test_config_path.parent / "test_mixed_dest"
         
         # Test copy + dry-run
         result = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(dest_path),
             "--copy",
             "--dry-run",
@@ -218,14 +207,14 @@ class TestBasicOperations:
         # Verify no actual operations occurred
         assert not dest_path.exists()
     
-    def test_source_dest_args_vs_flags(self, cli_runner, temp_source_folder, test_config_path):
+    def test_source_dest_args_vs_flags(self, cli_runner, shared_source_folder, test_config_path):
         """Test positional args vs --source/--dest flags."""
         dest1 = test_config_path.parent / "dest1"
         dest2 = test_config_path.parent / "dest2"
         
         # Test with positional arguments
         result1 = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(dest1),
             "--dry-run",
             config_path=test_config_path
@@ -236,7 +225,7 @@ class TestBasicOperations:
         
         # Test with flags
         result2 = cli_runner(
-            "--source", str(temp_source_folder),
+            "--source", str(shared_source_folder),
             "--dest", str(dest2),
             "--dry-run",
             config_path=test_config_path
@@ -247,7 +236,7 @@ class TestBasicOperations:
         
         # Test flags override positional
         result3 = cli_runner(
-            str(temp_source_folder),
+            str(shared_source_folder),
             str(dest1),
             "--dest", str(dest2),
             "--dry-run",
@@ -0,0 +1,209 @@
+"""
+Test the persistent SQLite metadata cache.
+"""
+
+import subprocess
+
+import pytest
+
+from photosort.cache import MetadataCache
+from photosort.core import PhotoSorter
+
+
+KIND = "test-kind"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """A writable metadata cache in a fresh directory."""
+    cache = MetadataCache(tmp_path / "cache" / "metadata.db")
+    yield cache
+    cache.close()
+
+
+class TestMetadataCache:
+    """Test storing, validating, and reading cached records."""
+
+    def test_round_trip(self, cache):
+        """Test that stored records are returned for unchanged files."""
+        cache.put_many(KIND, [
+            ("/photos/a.jpg", 100, 1_000, {"date": "2024-01-01T03:00:00"}),
+            ("/photos/b.mov", 200, 2_000, {"ContentIdentifier": "ABC"}),
+        ])
+
+        hits = cache.get_many(KIND, {
+            "/photos/a.jpg": (100, 1_000),
+            "/photos/b.mov": (200, 2_000),
+            "/photos/c.jpg": (300, 3_000),
+        })
+        assert hits == {
+            "/photos/a.jpg": {"date": "2024-01-01T03:00:00"},
+            "/photos/b.mov": {"ContentIdentifier": "ABC"},
+        }
+
+    def test_round_trip_across_query_chunks(self, cache):
+        """Test lookups of more paths than fit in one query."""
+        count = MetadataCache._QUERY_CHUNK * 2 + 1
+        cache.put_many(KIND, ((f"/photos/{i}.jpg", i, i, {"n": i}) for i in range(count)))
+
+        hits = cache.get_many(KIND, {f"/photos/{i}.jpg": (i, i) for i in range(count)})
+        assert len(hits) == count
+        assert hits[f"/photos/{count - 1}.jpg"] == {"n": count - 1}
+
+    def test_replaces_records(self, cache):
+        """Test that storing a path again replaces its record."""
+        cache.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+        cache.put_many(KIND, [("/photos/a.jpg", 100, 2_000, {"n": 2})])
+
+        assert cache.get_many(KIND, {"/photos/a.jpg": (100, 2_000)}) == {"/photos/a.jpg": {"n": 2}}
+
+    def test_kinds_are_separate(self, cache):
+        """Test that records are only returned for the kind they were stored under."""
+        cache.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+
+        assert cache.get_many("other-kind", {"/photos/a.jpg": (100, 1_000)}) == {}
+
+    @pytest.mark.parametrize("size, mtime_ns", [(101, 1_000), (100, 1_001)])
+    def test_miss_when_file_changes(self, cache, size, mtime_ns):
+        """Test that a changed size or mtime invalidates the record."""
+        cache.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+
+        assert cache.get_many(KIND, {"/photos/a.jpg": (size, mtime_ns)}) == {}
+
+    def test_records_persist_across_instances(self, tmp_path):
+        """Test that records are read back after reopening the database."""
+        db_path = tmp_path / "metadata.db"
+        writer = MetadataCache(db_path)
+        writer.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+        writer.close()
+
+        reader = MetadataCache(db_path)
+        assert reader.get_many(KIND, {"/photos/a.jpg": (100, 1_000)}) == {"/photos/a.jpg": {"n": 1}}
+        reader.close()
+
+    def test_read_only_creates_nothing(self, tmp_path):
+        """Test that a read-only cache without a database creates no files."""
+        cache_dir = tmp_path / "cache"
+        cache = MetadataCache(cache_dir / "metadata.db", read_only=True)
+
+        cache.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+        assert cache.get_many(KIND, {"/photos/a.jpg": (100, 1_000)}) == {}
+        assert cache.prune(KIND, "/photos/", keep=set()) == 0
+        cache.close()
+
+        assert not cache_dir.exists()
+
+    def test_read_only_writes_nothing(self, tmp_path):
+        """Test that a read-only cache reads an existing database without changing it."""
+        db_path = tmp_path / "metadata.db"
+        writer = MetadataCache(db_path)
+        writer.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+        writer.close()
+        contents = db_path.read_bytes()
+
+        cache = MetadataCache(db_path, read_only=True)
+        assert cache.get_many(KIND, {"/photos/a.jpg": (100, 1_000)}) == {"/photos/a.jpg": {"n": 1}}
+        cache.put_many(KIND, [
+            ("/photos/a.jpg", 100, 1_000, {"n": 2}),
+            ("/photos/b.jpg", 200, 2_000, {"n": 3}),
+        ])
+        assert cache.prune(KIND, "/photos/", keep=set()) == 0
+        cache.close()
+
+        assert db_path.read_bytes() == contents
+        reader = MetadataCache(db_path)
+        assert reader.get_many(KIND, {
+            "/photos/a.jpg": (100, 1_000),
+            "/photos/b.jpg": (200, 2_000),
+        }) == {"/photos/a.jpg": {"n": 1}}
+        reader.close()
+
+    def test_close_is_idempotent(self, cache):
+        """Test that close can be called repeatedly and the cache reopens on next use."""
+        cache.close()
+        cache.put_many(KIND, [("/photos/a.jpg", 100, 1_000, {"n": 1})])
+        cache.close()
+        cache.close()
+
+        assert cache.get_many(KIND, {"/photos/a.jpg": (100, 1_000)}) == {"/photos/a.jpg": {"n": 1}}
+
+
+class TestMetadataCachePrune:
+    """Test removal of stale records under a source folder."""
+
+    def test_prune_keeps_listed_and_outside_records(self, cache):
+        """Test that only unlisted records under the prefix are deleted."""
+        cache.put_many(KIND, [
+            ("/photos/a.jpg", 1, 1, {}),
+            ("/photos/sub/b.jpg", 1, 1, {}),
+            ("/photos/gone.jpg", 1, 1, {}),
+            ("/photos2/c.jpg", 1, 1, {}),
+            ("/other/d.jpg", 1, 1, {}),
+        ])
+        cache.put_many("other-kind", [("/photos/gone.jpg", 1, 1, {})])
+
+        assert cache.prune(KIND, "/photos/", keep={"/photos/a.jpg", "/photos/sub/b.jpg"}) == 1
+
+        keys = {path: (1, 1) for path in (
+            "/photos/a.jpg", "/photos/sub/b.jpg", "/photos/gone.jpg", "/photos2/c.jpg", "/other/d.jpg")}
+        assert set(cache.get_many(KIND, keys)) == {
+            "/photos/a.jpg", "/photos/sub/b.jpg", "/photos2/c.jpg", "/other/d.jpg"}
+        assert cache.get_many("other-kind", {"/photos/gone.jpg": (1, 1)}) == {"/photos/gone.jpg": {}}
+
+    def test_prune_prefix_with_wildcards(self, cache):
+        """Test that LIKE wildcards in the prefix are matched literally."""
+        cache.put_many(KIND, [
+            ("/photos/100%_done/a.jpg", 1, 1, {}),
+            ("/photos/100X_done/b.jpg", 1, 1, {}),
+            ("/photos/100%Xdone/c.jpg", 1, 1, {}),
+            ("/photos/100%_done_old/d.jpg", 1, 1, {}),
+        ])
+
+        assert cache.prune(KIND, "/photos/100%_done/", keep=set()) == 1
+
+        keys = {path: (1, 1) for path in (
+            "/photos/100%_done/a.jpg", "/photos/100X_done/b.jpg",
+            "/photos/100%Xdone/c.jpg", "/photos/100%_done_old/d.jpg")}
+        assert set(cache.get_many(KIND, keys)) == {
+            "/photos/100X_done/b.jpg", "/photos/100%Xdone/c.jpg", "/photos/100%_done_old/d.jpg"}
+
+
+class TestCreationDateCache:
+    """Test which read-ahead creation dates are cached by PhotoSorter."""
+
+    @pytest.mark.parametrize("failure", ["error", "no-dates"])
+    def test_fallback_dates_are_not_cached(self, cli_runner, tmp_path, test_config_path,
+                                           monkeypatch, failure):
+        """Test that sips or mtime dates for photos exiftool didn't date are not cached."""
+        from photosort import core, timestamps
+
+        source = tmp_path / "source"
+        source.mkdir()
+        undated = [source / "undated1.png", source / "undated2.png"]
+        dated = source / "dated.png"
+        for path in (*undated, dated):
+            path.write_bytes(path.name.encode())
+
+        def fake_exiftool_json(args, daemon=None):
+            if failure == "error":
+                raise subprocess.CalledProcessError(1, "exiftool")
+            for path in undated:
+                yield {"SourceFile": str(path)}
+            yield {"SourceFile": str(dated), "DateTimeOriginal": "2024:03:05 10:11:12"}
+        monkeypatch.setattr(core, "exiftool_available", True)
+        monkeypatch.setattr(timestamps, "exiftool_available", True)
+        monkeypatch.setattr(timestamps, "exiftool_json", fake_exiftool_json)
+
+        result = cli_runner(str(source), str(tmp_path / "dest"), "--copy", "--yes",
+                            config_path=test_config_path)
+        assert result.exit_code == 0
+
+        cache = MetadataCache(test_config_path.parent / "cache" / "exif_cache.db", read_only=True)
+        keys = {str(path): (path.stat().st_size, path.stat().st_mtime_ns)
+                for path in (*undated, dated)}
+        records = cache.get_many(PhotoSorter.CREATION_DATE_CACHE_KIND, keys)
+        cache.close()
+
+        assert not any(str(path) in records for path in undated)
+        # Only a date exiftool actually read is cached
+        assert (str(dated) in records) == (failure == "no-dates")
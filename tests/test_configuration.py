@@ -148,6 +148,50 @@ class TestConfiguration:
         help_result = cli_runner("--help", config_path=test_config_path)
         assert "PST" in help_result.output
 
+    def test_timezone_change_rereads_cached_dates(self, cli_runner, tmp_path, test_config_path,
+                                                  monkeypatch):
+        """Test that cached creation dates are not reused after the timezone changes."""
+        from photosort import core, timestamps
+
+        source = tmp_path / "source"
+        source.mkdir()
+        (source / "photo.png").write_bytes(b"not really a png")
+
+        # Metadata reads return 03:00 UTC on New Year's Day, converted to the current zone
+        reads = []
+        def fake_image_dates(paths, daemon=None):
+            reads.extend(paths)
+            return {p: timestamps.parse_iso8601_datetime("2024-01-01T03:00:00Z") for p in paths}, {}
+        monkeypatch.setattr(core, "read_image_creation_dates", fake_image_dates)
+
+        def run_in_zone(tz_name, dest_name):
+            monkeypatch.setattr(timestamps, "config_tz", tz_name)
+            timestamps.default_timezone.cache_clear()
+            dest = tmp_path / dest_name
+            result = cli_runner(str(source), str(dest), "--copy", "--yes",
+                                config_path=test_config_path)
+            assert result.exit_code == 0
+            return dest
+
+        try:
+            dest1 = run_in_zone("America/New_York", "dest_ny")
+            assert len(reads) == 1
+            assert list((dest1 / "2023" / "12").glob("*.png"))
+
+            # The first run's cached date was converted to New York time
+            dest2 = run_in_zone("UTC", "dest_utc")
+            assert len(reads) == 2
+            assert list((dest2 / "2024" / "01").glob("*.png"))
+            assert not (dest2 / "2023").exists()
+
+            # Unchanged zone: the date cached by the second run is reused
+            dest3 = run_in_zone("UTC", "dest_utc_again")
+            assert len(reads) == 2
+            assert list((dest3 / "2024" / "01").glob("*.png"))
+        finally:
+            monkeypatch.undo()
+            timestamps.default_timezone.cache_clear()
+
     def test_config_overrides(self, cli_runner, temp_source_folder, test_config_path):
         """Test that CLI flags override saved config values."""
         dest_path1 = test_config_path.parent / "test_overrides_1"
@@ -0,0 +1,108 @@
+"""
+Test streaming parsing of exiftool -json output.
+"""
+
+from photosort.exiftool import iter_json_records
+
+
+def output_lines(text):
+    """Split exiftool output into byte lines as read from its stdout pipe."""
+    return text.encode().splitlines(keepends=True)
+
+
+class TestIterJsonRecords:
+    """Test incremental parsing of exiftool's JSON array layout."""
+
+    def test_single_record(self):
+        """Test a one-element array closed by "}]"."""
+        lines = output_lines(
+            '[{\n'
+            '  "SourceFile": "/photos/IMG_0001.JPG",\n'
+            '  "CreateDate": "2024:03:05 10:11:12"\n'
+            '}]\n'
+        )
+
+        assert list(iter_json_records(lines)) == [
+            {"SourceFile": "/photos/IMG_0001.JPG", "CreateDate": "2024:03:05 10:11:12"},
+        ]
+
+    def test_multiple_records(self):
+        """Test records separated by "},{" lines."""
+        lines = output_lines(
+            '[{\n'
+            '  "SourceFile": "/photos/IMG_0001.JPG",\n'
+            '  "ContentIdentifier": "ABC"\n'
+            '},\n'
+            '{\n'
+            '  "SourceFile": "/photos/IMG_0001.MOV",\n'
+            '  "ContentIdentifier": "ABC"\n'
+            '},\n'
+            '{\n'
+            '  "SourceFile": "/photos/IMG_0002.JPG"\n'
+            '}]\n'
+        )
+
+        assert [r["SourceFile"] for r in iter_json_records(lines)] == [
+            "/photos/IMG_0001.JPG", "/photos/IMG_0001.MOV", "/photos/IMG_0002.JPG",
+        ]
+
+    def test_empty_array(self):
+        """Test that an empty array or no output yields no records."""
+        assert list(iter_json_records(output_lines('[]\n'))) == []
+        assert list(iter_json_records(output_lines('[\n]\n'))) == []
+        assert list(iter_json_records([])) == []
+
+    def test_separate_closing_bracket(self):
+        """Test a final "}" followed by "]" on its own line."""
+        lines = output_lines(
+            '[{\n'
+            '  "SourceFile": "/photos/IMG_0001.JPG"\n'
+            '},\n'
+            '{\n'
+            '  "SourceFile": "/photos/IMG_0002.JPG"\n'
+            '}\n'
+            ']\n'
+        )
+
+        assert list(iter_json_records(lines)) == [
+            {"SourceFile": "/photos/IMG_0001.JPG"},
+            {"SourceFile": "/photos/IMG_0002.JPG"},
+        ]
+
+    def test_nested_objects(self):
+        """Test that indented closing braces of nested structures don't end a record."""
+        lines = output_lines(
+            '[{\n'
+            '  "SourceFile": "/photos/IMG_0001.JPG",\n'
+            '  "Region": {\n'
+            '    "Name": "x"\n'
+            '  },\n'
+            '  "CreateDate": "2024:03:05 10:11:12"\n'
+            '}]\n'
+        )
+
+        assert list(iter_json_records(lines)) == [{
+            "SourceFile": "/photos/IMG_0001.JPG",
+            "Region": {"Name": "x"},
+            "CreateDate": "2024:03:05 10:11:12",
+        }]
+
+    def test_malformed_record_is_skipped(self):
+        """Test that a corrupt record between valid ones doesn't lose the others."""
+        lines = output_lines(
+            '[{\n'
+            '  "SourceFile": "/photos/IMG_0001.JPG"\n'
+            '},\n'
+            '{\n'
+            '  "SourceFile": "/photos/IMG_0002.JPG",\n'
+            '  "Comment": "unterminated\n'
+            '},\n'
+            '{\n'
+            '  "SourceFile": "/photos/IMG_0003.JPG"\n'
+            '}]\n'
+        )
+
+        assert list(iter_json_records(lines)) == [
+            {"SourceFile": "/photos/IMG_0001.JPG"},
+            {"SourceFile": "/photos/IMG_0003.JPG"},
+        ]
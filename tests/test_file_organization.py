@@ -6,6 +6,8 @@ import pytest
 from datetime import datetime
 from pathlib import Path
 
+from .conftest import count_media_files, find_media_files, has_media_files, iter_files, list_files
+
 
 class TestFileOrganization:
     """Test file organization and naming conventions."""
@@ -56,37 +58,36 @@ class TestFileOrganization:
         pattern = r'^\d{8}_\d{6}_\d{3}(_\d{2})?\.\w+$'
         import re
         
-        for file_path in dest_path.rglob("*"):
-            if file_path.is_file():
-                filename = file_path.name
-                # Skip if it's in history subdirectory
-                if "history" in str(file_path):
-                    continue
-                    
-                assert re.match(pattern, filename), \
-                    f"Filename '{filename}' doesn't match expected format"
-                
-                # Verify date components are valid
-                date_part = filename[:8]
-                time_part = filename[9:15]
-                
-                # Parse and validate date
-                year = int(date_part[:4])
-                month = int(date_part[4:6])
-                day = int(date_part[6:8])
+        for file_path in list_files(dest_path):
+            filename = file_path.name
+            # Skip if it's in history subdirectory
+            if "history" in str(file_path):
+                continue
                 
-                assert 1900 <= year <= 2100, f"Invalid year: {year}"
-                assert 1 <= month <= 12, f"Invalid month: {month}"
-                assert 1 <= day <= 31, f"Invalid day: {day}"
-                
-                # Parse and validate time
-                hour = int(time_part[:2])
-                minute = int(time_part[2:4])
-                second = int(time_part[4:6])
-                
-                assert 0 <= hour <= 23, f"Invalid hour: {hour}"
-                assert 0 <= minute <= 59, f"Invalid minute: {minute}"
-                assert 0 <= second <= 59, f"Invalid second: {second}"
+            assert re.match(pattern, filename), \
+                f"Filename '{filename}' doesn't match expected format"
+            
+            # Verify date components are valid
+            date_part = filename[:8]
+            time_part = filename[9:15]
+            
+            # Parse and validate date
+            year = int(date_part[:4])
+            month = int(date_part[4:6])
+            day = int(date_part[6:8])
+            
+            assert 1900 <= year <= 2100, f"Invalid year: {year}"
+            assert 1 <= month <= 12, f"Invalid month: {month}"
+            assert 1 <= day <= 31, f"Invalid day: {day}"
+            
+            # Parse and validate time
+            hour = int(time_part[:2])
+            minute = int(time_part[2:4])
+            second = int(time_part[4:6])
+            
+            assert 0 <= hour <= 23, f"Invalid hour: {hour}"
+            assert 0 <= minute <= 59, f"Invalid minute: {minute}"
+            assert 0 <= second <= 59, f"Invalid second: {second}"
     
     def test_duplicate_detection(self, cli_runner, test_config_path, create_test_files):
         """Test that duplicate files are detected and skipped."""
@@ -116,9 +117,9 @@ class TestFileOrganization:
             assert "1" in result1.output or "duplicate" in result1.output.lower()
         
         # Count files in destination
-        dest_files = list(dest_path.rglob("*.jpg"))
         # Should have 3 files (2 unique + 1 of the duplicates)
-        assert len(dest_files) == 3, "Should have 3 files after skipping duplicate"
+        assert count_media_files(dest_path, (".jpg",)) == 3, \
+            "Should have 3 files after skipping duplicate"
     
     def test_burst_sequence_counter(self, cli_runner, test_config_path, create_test_files):
         """Test sequential counter for same-timestamp files (bursts)."""
@@ -147,7 +148,7 @@ class TestFileOrganization:
         burst_files = []
         expected_base = "20240115_103045"
         
-        for file_path in dest_path.rglob("*.jpg"):
+        for file_path in find_media_files(dest_path, (".jpg",)):
             if expected_base in file_path.name:
                 burst_files.append(file_path.name)
         
@@ -171,11 +172,7 @@ class TestFileOrganization:
         
         # Count metadata files in source
         metadata_extensions = ['.aae', '.xml', '.json', '.ini']
-        metadata_files = []
-        for ext in metadata_extensions:
-            metadata_files.extend(temp_source_folder.rglob(f"*{ext}"))
-        
-        initial_metadata_count = len(metadata_files)
+        initial_metadata_count = count_media_files(temp_source_folder, metadata_extensions)
         
         result = cli_runner(
             str(temp_source_folder),
@@ -191,14 +188,12 @@ class TestFileOrganization:
             
             # Verify metadata files are in history
             metadata_dir = history_folder / "Metadata"
-            history_metadata = list(metadata_dir.rglob("*"))
+            history_metadata = list_files(metadata_dir)
             assert len(history_metadata) > 0, "Metadata files should be in history"
             
             # Verify no metadata files in destination
-            for ext in metadata_extensions:
-                dest_metadata = list(dest_path.rglob(f"*{ext}"))
-                assert len(dest_metadata) == 0, \
-                    f"No {ext} files should be in destination"
+            assert not has_media_files(dest_path, metadata_extensions), \
+                "No metadata files should be in destination"
     
     def test_extension_normalization(self, cli_runner, test_config_path, create_test_files):
         """Test that file extensions are normalized (e.g., .JPEG -> .jpg)."""
@@ -221,12 +216,14 @@ class TestFileOrganization:
         assert result.exit_code == 0
         
         # All JPEG variants should be normalized to .jpg
-        jpg_files = list(dest_path.rglob("*.jpg"))
+        # Extensions are compared case-sensitively here, unlike find_media_files
+        dest_names = [entry.name for entry in iter_files(dest_path)]
+        jpg_files = [name for name in dest_names if name.endswith(".jpg")]
         assert len(jpg_files) == 4, "All JPEG variants should be normalized to .jpg"
         
         # Should be no files with original extensions
         for ext in [".JPEG", ".JPG", ".jpeg", ".JPE"]:
-            assert len(list(dest_path.rglob(f"*{ext}"))) == 0, \
+            assert not any(name.endswith(ext) for name in dest_names), \
                 f"No files with {ext} extension should exist"
     
     def test_source_cleanup(self, cli_runner, test_config_path, create_test_files):
@@ -258,11 +255,12 @@ class TestFileOrganization:
         
         # Check source directory state after move
         # - Media files should be gone
-        assert len(list(source_path.rglob("*.jpg"))) == 0, "JPG files should be moved"
-        assert len(list(source_path.rglob("*.mp4"))) == 0, "MP4 files should be moved"
+        assert not has_media_files(source_path, (".jpg",)), "JPG files should be moved"
+        assert not has_media_files(source_path, (".mp4",)), "MP4 files should be moved"
         
         # - .DS_Store files should be removed
-        assert len(list(source_path.rglob(".DS_Store"))) == 0, ".DS_Store should be removed"
+        assert not any(entry.name == ".DS_Store" for entry in iter_files(source_path)), \
+            ".DS_Store should be removed"
         
         # - Empty directories should be removed
         assert not empty_dir.exists(), "Empty directories should be removed"
@@ -7,6 +7,8 @@ import stat
 import pytest
 from pathlib import Path
 
+from .conftest import list_files
+
 
 class TestFilePermissions:
     """Test file mode and group ownership functionality."""
@@ -24,8 +26,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check file permissions on destination files
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             # Check at least one file has expected permissions
@@ -51,8 +52,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check file permissions
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             for file_path in media_files[:3]:  # Check first few files
@@ -74,8 +74,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check file permissions
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             for file_path in media_files[:3]:  # Check first few files
@@ -97,8 +96,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check file permissions
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             for file_path in media_files[:3]:  # Check first few files
@@ -122,8 +120,7 @@ class TestFilePermissions:
             assert "Invalid file mode" in result.output or "mode" in result.output.lower()
         else:
             # If it succeeds, files should have reasonable permissions
-            dest_files = list(dest_path.rglob("*"))
-            media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+            media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
             
             if media_files:
                 file_mode = oct(stat.S_IMODE(media_files[0].stat().st_mode))
@@ -162,8 +159,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check group ownership
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             # Check file has expected group (if permission allows)
@@ -220,8 +216,7 @@ class TestFilePermissions:
         else:
             # If it succeeds, should have warning about invalid group
             # Files should still be processed
-            dest_files = list(dest_path.rglob("*"))
-            media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+            media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
             assert len(media_files) > 0, "Files should still be processed"
     
     def test_mode_and_group_together(self, cli_runner, temp_source_folder, test_config_path):
@@ -255,8 +250,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check both mode and group
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             sample_file = media_files[0]
@@ -313,8 +307,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check permissions on copied files
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             for file_path in media_files[:3]:  # Check first few files
@@ -403,8 +396,7 @@ class TestFilePermissions:
         assert result.exit_code == 0
         
         # Check permissions on all destination files
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
         
         if media_files:
             for file_path in media_files:
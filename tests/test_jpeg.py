@@ -0,0 +1,157 @@
+"""
+Test the in-process JPEG EXIF reader used for Live Photo detection.
+"""
+
+import struct
+
+import pytest
+
+from photosort.jpeg import read_livephoto_tags
+
+
+CONTENT_ID = "A1B2C3D4-E5F6-4711-8899-AABBCCDDEEFF"
+
+
+def build_ifd(order, entries, start):
+    """Build an IFD at offset start, with out-of-line values placed after it.
+
+    entries are (tag, type, count, value bytes); offsets are relative to the
+    start of the enclosing block. Returns the IFD followed by its value data.
+    """
+    body = struct.pack(f"{order}H", len(entries))
+    data = b""
+    data_start = start + 2 + 12 * len(entries) + 4
+    for tag, field_type, count, value in entries:
+        if len(value) <= 4:
+            body += struct.pack(f"{order}HHI", tag, field_type, count) + value.ljust(4, b"\x00")
+        else:
+            body += struct.pack(f"{order}HHII", tag, field_type, count, data_start + len(data))
+            data += value + b"\x00" * (len(value) % 2)
+    return body + struct.pack(f"{order}I", 0) + data
+
+
+def ascii_entry(tag, text):
+    """An ASCII tag entry with its NUL terminator."""
+    value = text.encode() + b"\x00"
+    return (tag, 2, len(value), value)
+
+
+def apple_maker_note(content_id):
+    """An Apple MakerNote: header, then a big-endian IFD at offset 14."""
+    entries = [(0x0001, 9, 1, struct.pack(">i", 14)), ascii_entry(0x0011, content_id)]
+    return b"Apple iOS\x00" + b"\x00\x01" + b"MM" + build_ifd(">", entries, 14)
+
+
+def build_tiff(order="<", maker_note=None):
+    """A TIFF block with IFD0 pointing to an Exif IFD holding the Live Photo tags."""
+    exif_entries = [
+        ascii_entry(0x9004, "2024:03:05 10:11:12"),
+        ascii_entry(0x9012, "-05:00"),
+        ascii_entry(0x9292, "123"),
+    ]
+    if maker_note is not None:
+        exif_entries.append((0x927C, 7, len(maker_note), maker_note))
+
+    exif_start = 8 + 2 + 12 + 4  # TIFF header plus a one-entry IFD0
+    ifd0 = build_ifd(order, [(0x8769, 4, 1, struct.pack(f"{order}I", exif_start))], 8)
+    byte_order = b"II" if order == "<" else b"MM"
+    return byte_order + struct.pack(f"{order}HI", 42, 8) + ifd0 + build_ifd(order, exif_entries, exif_start)
+
+
+def build_jpeg(tiff=None):
+    """A minimal JPEG: SOI, JFIF APP0, optional EXIF APP1, then scan data and EOI."""
+    app0_payload = b"JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+    segments = b"\xff\xe0" + struct.pack(">H", len(app0_payload) + 2) + app0_payload
+    if tiff is not None:
+        app1_payload = b"Exif\x00\x00" + tiff
+        segments += b"\xff\xe1" + struct.pack(">H", len(app1_payload) + 2) + app1_payload
+    return b"\xff\xd8" + segments + b"\xff\xda\x00\x02" + b"\x00" * 16 + b"\xff\xd9"
+
+
+@pytest.fixture
+def write_jpeg(tmp_path):
+    """Write JPEG bytes to a file and return its path."""
+    def write(data, name="IMG_0001.JPG"):
+        path = tmp_path / name
+        path.write_bytes(data)
+        return path
+    return write
+
+
+class TestReadLivePhotoTags:
+    """Test EXIF parsing of synthetic JPEGs."""
+
+    @pytest.mark.parametrize("order", ["<", ">"])
+    def test_apple_content_identifier(self, write_jpeg, order):
+        """Test that tags are read from little- and big-endian TIFF headers."""
+        path = write_jpeg(build_jpeg(build_tiff(order, apple_maker_note(CONTENT_ID))))
+
+        assert read_livephoto_tags(path) == {
+            "SourceFile": str(path),
+            "CreateDate": "2024:03:05 10:11:12",
+            "SubSecCreateDate": "2024:03:05 10:11:12.123-05:00",
+            "ContentIdentifier": CONTENT_ID,
+        }
+
+    def test_non_apple_maker_note(self, write_jpeg):
+        """Test that a MakerNote from another vendor yields no ContentIdentifier."""
+        path = write_jpeg(build_jpeg(build_tiff("<", b"Nikon\x00\x02\x10\x00\x00MM\x00\x2a")))
+
+        record = read_livephoto_tags(path)
+        assert record["CreateDate"] == "2024:03:05 10:11:12"
+        assert "ContentIdentifier" not in record
+
+    def test_missing_exif_segment(self, write_jpeg):
+        """Test that a JPEG without an EXIF APP1 segment has no tags."""
+        path = write_jpeg(build_jpeg())
+
+        assert read_livephoto_tags(path) == {"SourceFile": str(path)}
+
+    def test_not_a_jpeg(self, write_jpeg):
+        """Test that non-JPEG input is left for exiftool."""
+        path = write_jpeg(b"\x89PNG\r\n\x1a\n" + b"\x00" * 32, name="image.jpg")
+
+        assert read_livephoto_tags(path) is None
+
+    def test_missing_file(self, tmp_path):
+        """Test that an unreadable file is left for exiftool."""
+        assert read_livephoto_tags(tmp_path / "missing.jpg") is None
+
+    def test_truncated_segment(self, write_jpeg):
+        """Test that a segment cut off before its length is left for exiftool."""
+        data = build_jpeg(build_tiff("<", apple_maker_note(CONTENT_ID)))
+        path = write_jpeg(data[:data.index(b"\xff\xe1") + 3])
+
+        assert read_livephoto_tags(path) is None
+
+    def test_truncated_ifd(self, write_jpeg):
+        """Test that EXIF data cut off inside an IFD is left for exiftool."""
+        tiff = build_tiff(">", apple_maker_note(CONTENT_ID))
+        path = write_jpeg(build_jpeg(tiff[:30]))
+
+        assert read_livephoto_tags(path) is None
+
+    def test_ifd_offset_out_of_range(self, write_jpeg):
+        """Test that an IFD0 offset past the end of the EXIF block is left for exiftool."""
+        tiff = bytearray(build_tiff("<"))
+        tiff[4:8] = struct.pack("<I", len(tiff) + 100)
+        path = write_jpeg(build_jpeg(bytes(tiff)))
+
+        assert read_livephoto_tags(path) is None
+
+    def test_value_offset_out_of_range(self, write_jpeg):
+        """Test that a tag value pointing past the end of the EXIF block is left for exiftool."""
+        tiff = bytearray(build_tiff("<", apple_maker_note(CONTENT_ID)))
+        # The first Exif IFD entry (CreateDate) stores its value out of line
+        value_offset = 8 + 2 + 12 + 4 + 2 + 8
+        tiff[value_offset:value_offset + 4] = struct.pack("<I", len(tiff))
+        path = write_jpeg(build_jpeg(bytes(tiff)))
+
+        assert read_livephoto_tags(path) is None
+
+    def test_bad_byte_order(self, write_jpeg):
+        """Test that a TIFF header with an unknown byte order is left for exiftool."""
+        tiff = b"XX" + build_tiff("<")[2:]
+        path = write_jpeg(build_jpeg(tiff))
+
+        assert read_livephoto_tags(path) is None
@@ -3,8 +3,11 @@ Test Live Photo detection and processing.
 """
 
 import pytest
+from datetime import datetime
 from pathlib import Path
 
+from .conftest import list_files
+
 
 class TestLivePhotoProcessing:
     """Test Apple Live Photo pair detection and processing."""
@@ -66,12 +69,11 @@ class TestLivePhotoProcessing:
         # Even without exiftool, basename matching should work
         # Look for pairs with same basename
         dest_files = {}
-        for f in dest_path.rglob("*"):
-            if f.is_file():
-                basename = f.stem
-                if basename not in dest_files:
-                    dest_files[basename] = []
-                dest_files[basename].append(f.suffix.lower())
+        for f in list_files(dest_path):
+            basename = f.stem
+            if basename not in dest_files:
+                dest_files[basename] = []
+            dest_files[basename].append(f.suffix.lower())
 
         # Check for basenames with both photo and video extensions
         photo_exts = {'.jpg', '.jpeg', '.heic'}
@@ -114,8 +116,7 @@ class TestLivePhotoProcessing:
         # This is expected behavior for mock test files without ContentIdentifier metadata
 
         # Verify all files were processed successfully
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
 
         # Should have processed all 4 source files
         assert len(media_files) == 4, f"Expected 4 files, got {len(media_files)}"
@@ -124,6 +125,91 @@ class TestLivePhotoProcessing:
         year_dirs = [d for d in dest_path.iterdir() if d.is_dir() and d.name.isdigit()]
         assert len(year_dirs) > 0, "Should have year directory structure"
 
+    def test_concurrent_pairs_with_shared_basenames(self, cli_runner, test_config_path,
+                                                    create_test_files):
+        """Test that concurrently processed pairs never overwrite each other."""
+        # Identical timestamps force every pair onto the same shared basename
+        timestamp = datetime(2024, 3, 15, 10, 30, 0)
+        source_files = []
+        for i in range(12):
+            source_files.append({"name": f"IMG_{i:04d}.heic", "content": f"photo {i}".encode(),
+                                 "mtime": timestamp})
+            source_files.append({"name": f"IMG_{i:04d}.mov", "content": f"video {i}".encode(),
+                                 "mtime": timestamp})
+
+        source_path = create_test_files(source_files)
+        dest_path = test_config_path.parent / "test_concurrent_pairs"
+
+        result = cli_runner(
+            str(source_path),
+            str(dest_path),
+            config_path=test_config_path
+        )
+
+        assert result.exit_code == 0
+
+        # Every file should arrive under a distinct name
+        media_files = list_files(dest_path)
+        assert len(media_files) == 24, f"Expected 24 files, got {len(media_files)}"
+        contents = {f.read_bytes() for f in media_files}
+        assert len(contents) == 24, "No file should be overwritten by another"
+
+    def test_threads_option(self, cli_runner, test_config_path, create_test_files):
+        """Test that --threads sets the pair worker count and rejects invalid values."""
+        timestamp = datetime(2024, 3, 15, 10, 30, 0)
+        source_files = []
+        for i in range(4):
+            source_files.append({"name": f"IMG_{i:04d}.heic", "content": f"photo {i}".encode(),
+                                 "mtime": timestamp})
+            source_files.append({"name": f"IMG_{i:04d}.mov", "content": f"video {i}".encode(),
+                                 "mtime": timestamp})
+
+        source_path = create_test_files(source_files)
+        dest_path = test_config_path.parent / "test_threads_option"
+
+        result = cli_runner(
+            str(source_path),
+            str(dest_path),
+            "--threads", "1",
+            config_path=test_config_path
+        )
+
+        assert result.exit_code == 0
+        media_files = list_files(dest_path)
+        assert len(media_files) == 8, f"Expected 8 files, got {len(media_files)}"
+
+        result = cli_runner(
+            str(source_path),
+            str(dest_path),
+            "--threads", "0",
+            config_path=test_config_path
+        )
+        assert result.exit_code != 0
+
+    def test_extra_same_stem_image_is_processed(self, cli_runner, test_config_path,
+                                                create_test_files):
+        """Test that a second image sharing a pair's stem is not dropped."""
+        source_files = [
+            {"name": "IMG_0001.heic", "content": b"pair photo"},
+            {"name": "IMG_0001.jpg", "content": b"same stem photo"},
+            {"name": "IMG_0001.mov", "content": b"pair video"},
+        ]
+
+        source_path = create_test_files(source_files)
+        dest_path = test_config_path.parent / "test_extra_same_stem"
+
+        result = cli_runner(
+            str(source_path),
+            str(dest_path),
+            config_path=test_config_path
+        )
+
+        assert result.exit_code == 0
+
+        # The unpaired image is processed individually alongside the pair
+        media_files = list_files(dest_path)
+        assert len(media_files) == 3, f"Expected 3 files, got {len(media_files)}"
+
     def test_livephoto_processing_order(self, cli_runner, test_config_path, create_test_files):
         """Test that Live Photos are processed before individual files."""
         # Create files that could cause naming conflicts
@@ -147,8 +233,7 @@ class TestLivePhotoProcessing:
         assert result.exit_code == 0
 
         # All files should be processed successfully without conflicts
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
 
         assert len(media_files) == 3, "All 3 files should be processed"
 
@@ -210,8 +295,7 @@ class TestLivePhotoProcessing:
 
         # With real test media, check if any Live Photo pairs were actually detected
         # This requires real EXIF ContentIdentifier metadata to work properly
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
 
         # Verify files were processed
         assert len(media_files) > 0, "Should have processed some media files"
@@ -309,8 +393,7 @@ class TestLivePhotoProcessing:
         assert result.exit_code == 0
 
         # All files should still be processed
-        dest_files = list(dest_path.rglob("*"))
-        media_files = [f for f in dest_files if f.is_file() and "history" not in str(f)]
+        media_files = [f for f in list_files(dest_path) if "history" not in str(f)]
 
         assert len(media_files) == 4, "All 4 files should be processed"
 
@@ -5,6 +5,8 @@ Test video conversion to H.265/MP4 and related operations.
 import pytest
 from pathlib import Path
 
+from .conftest import find_media_files, list_files
+
 
 class TestVideoConversion:
     """Test video format conversion and archival functionality."""
@@ -16,14 +18,11 @@ class TestVideoConversion:
         
         # Look for any video files that might need conversion
         legacy_formats = ['.avi', '.wmv', '.mpg', '.mpeg', '.flv', '.3gp']
-        legacy_videos = []
-        for fmt in legacy_formats:
-            legacy_videos.extend(temp_source_folder.rglob(f"*{fmt}"))
+        legacy_videos = find_media_files(temp_source_folder, legacy_formats)
         
         if not legacy_videos:
             # Try older .mov or .mp4 that might have old codecs
-            all_videos = list(temp_source_folder.rglob("*.mov")) + \
-                        list(temp_source_folder.rglob("*.mp4"))
+            all_videos = find_media_files(temp_source_folder, ('.mov', '.mp4'))
             if not all_videos:
                 pytest.skip("No video files in test media")
         
@@ -45,11 +44,11 @@ class TestVideoConversion:
             legacy_dir = history_folder / "LegacyVideos"
             
             # Should have original videos archived
-            archived_videos = list(legacy_dir.rglob("*"))
+            archived_videos = list_files(legacy_dir)
             assert len(archived_videos) > 0, "Converted videos should be archived"
             
             # Destination should have .mp4 files
-            converted_videos = list(dest_path.rglob("*.mp4"))
+            converted_videos = find_media_files(dest_path, (".mp4",))
             assert len(converted_videos) > 0, "Should have converted MP4 files"
     
     def test_modern_video_passthrough(self, cli_runner, test_config_path, create_test_files):
@@ -74,8 +73,8 @@ class TestVideoConversion:
         assert result.exit_code == 0
         
         # Modern videos should not be converted
-        dest_videos = list(dest_path.rglob("*"))
-        media_videos = [v for v in dest_videos if v.is_file() and "history" not in str(v)]
+        dest_videos = list_files(dest_path)
+        media_videos = [v for v in dest_videos if "history" not in str(v)]
         
         assert len(media_videos) == 3, "All modern videos should be processed"
         
@@ -211,7 +210,7 @@ class TestVideoConversion:
         assert result.exit_code == 0
         
         # Video should still be processed (moved/copied as-is)
-        dest_videos = list(dest_path.rglob("*.avi"))
+        dest_videos = find_media_files(dest_path, (".avi",))
         assert len(dest_videos) == 1, "Video should be processed even without conversion"
     
     def test_conversion_preserves_metadata(self, cli_runner, temp_source_folder, 
@@ -220,9 +219,7 @@ class TestVideoConversion:
         dest_path = test_config_path.parent / "test_metadata_preservation"
         
         # Find any videos in test media
-        videos = list(temp_source_folder.rglob("*.mov")) + \
-                list(temp_source_folder.rglob("*.mp4")) + \
-                list(temp_source_folder.rglob("*.avi"))
+        videos = find_media_files(temp_source_folder, ('.mov', '.mp4', '.avi'))
         
         if not videos:
             pytest.skip("No videos in test media")
@@ -264,7 +261,7 @@ class TestVideoConversion:
         # (Actual reduction depends on real video conversion)
         if "Converted Videos" in result.output and "│ 1" in result.output:
             # Check that converted file exists
-            mp4_files = list(dest_path.rglob("*.mp4"))
+            mp4_files = find_media_files(dest_path, (".mp4",))
             if mp4_files:
                 assert len(mp4_files) > 0, "Should have converted MP4 file"
     
@@ -290,8 +287,8 @@ class TestVideoConversion:
         assert result.exit_code == 0
         
         # All videos should be processed
-        dest_videos = list(dest_path.rglob("*.mp4")) + list(dest_path.rglob("*.mov"))
-        media_videos = [v for v in dest_videos if v.is_file() and "history" not in str(v)]
+        dest_videos = find_media_files(dest_path, ('.mp4', '.mov'))
+        media_videos = [v for v in dest_videos if "history" not in str(v)]
         
         assert len(media_videos) >= 2, "Should process all videos"
         